@@ -1,3 +1,3 @@
-from .pipeline import process_day
+from .pipeline import process_day, process_days
 
-__all__ = ["process_day"]
+__all__ = ["process_day", "process_days"]
@@ -5,6 +5,11 @@ import subprocess
 from pathlib import Path
 from typing import Sequence
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 
 def ensure_parent(path: Path) -> None:
     path.parent.mkdir(parents=True, exist_ok=True)
@@ -14,7 +19,23 @@ def run_command(command: Sequence[str]) -> None:
     subprocess.run(command, check=True)
 
 
+def read_json(path: Path):
+    if orjson is not None:
+        return orjson.loads(path.read_bytes())
+    with path.open("r", encoding="utf-8") as handle:
+        return json.load(handle)
+
+
+def read_json_bytes(data: bytes):
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
 def write_json(path: Path, payload: dict) -> None:
     ensure_parent(path)
+    if orjson is not None:
+        path.write_bytes(orjson.dumps(payload, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS))
+        return
     with path.open("w", encoding="utf-8") as handle:
         json.dump(payload, handle, ensure_ascii=False, indent=2)
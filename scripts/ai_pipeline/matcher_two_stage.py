@@ -8,8 +8,8 @@ from .quran import (
     _has_anchor_token_hit,
     _is_fatiha_like_segment,
     _is_non_recitation_segment,
+    _normalized_segment_text,
     _score_segment_against_entry,
-    normalize_arabic,
 )
 from .types import Marker, TranscriptSegment
 
@@ -208,7 +208,7 @@ def _build_segment_candidates(
     per_segment: list[list[SegmentCandidate]] = [[] for _ in transcript_segments]
     corpus_size = len(corpus_entries)
     for segment_index, segment in enumerate(transcript_segments):
-        normalized_text = normalize_arabic(str(segment.text or ""), strict=False)
+        normalized_text = _normalized_segment_text(segment)
         if len(normalized_text) < 3:
             continue
         if _is_fatiha_like_segment(normalized_text):
@@ -1,6 +1,10 @@
 from __future__ import annotations
 
 import json
+import os
+import traceback
+from bisect import bisect_left, bisect_right
+from concurrent.futures import ProcessPoolExecutor, as_completed
 from dataclasses import asdict
 from datetime import datetime, timezone
 from pathlib import Path
@@ -57,6 +61,31 @@ def _load_transcript_segments(path: Path) -> list[TranscriptSegment]:
     return transcript_segments
 
 
+class _LazyAsad:
+    def __init__(self, path: Path) -> None:
+        self.path = path
+        self._data: dict[tuple[int, int], str] | None = None
+
+    def _lookup(self) -> dict[tuple[int, int], str]:
+        if self._data is None:
+            self._data = load_asad_translation(self.path)
+        return self._data
+
+    @property
+    def available(self) -> bool:
+        # Answer from the cache file when no marker forced a parse, so the meta flag
+        # still reports whether the translation is on hand.
+        if self._data is None:
+            return self.path.exists()
+        return bool(self._data)
+
+    def __getitem__(self, key: tuple[int, int]) -> str:
+        return self._lookup()[key]
+
+    def get(self, key: tuple[int, int], default: str | None = None) -> str | None:
+        return self._lookup().get(key, default)
+
+
 def _map_reciter_to_markers(markers: list[Marker], prayers: list[PrayerSegment]) -> list[Marker]:
     if not markers or not prayers:
         return markers
@@ -895,6 +924,7 @@ def _resolve_day_match_constraints(
 
     for rows in by_surah.values():
         rows.sort(key=lambda item: item[0])
+    ayah_keys = {surah_number: [row[0] for row in rows] for surah_number, rows in by_surah.items()}
 
     def _start_index(surah: int | None, ayah: int | None) -> int | None:
         if surah is None:
@@ -906,10 +936,8 @@ def _resolve_day_match_constraints(
             return None
         if ayah is None:
             return rows[0][1]
-        for row_ayah, row_index in rows:
-            if row_ayah >= ayah:
-                return row_index
-        return None
+        position = bisect_left(ayah_keys[surah], ayah)
+        return rows[position][1] if position < len(rows) else None
 
     def _end_index(surah: int | None, ayah: int | None) -> int | None:
         if surah is None:
@@ -921,10 +949,8 @@ def _resolve_day_match_constraints(
             return None
         if ayah is None:
             return rows[-1][1]
-        for row_ayah, row_index in reversed(rows):
-            if row_ayah <= ayah:
-                return row_index
-        return None
+        position = bisect_right(ayah_keys[surah], ayah) - 1
+        return rows[position][1] if position >= 0 else None
 
     constraints: list[tuple[float, float, int | None, int | None]] = []
     for block in raw_blocks:
@@ -1213,14 +1239,46 @@ def process_day(
     progress.end("apply day overrides", t)
 
     t = progress.begin("enrich marker text + reciter mapping")
-    asad_lookup = load_asad_translation(asad_path) if asad_path else {}
-    markers = enrich_marker_texts(markers, corpus_entries, asad_lookup)
+    # Translation is only parsed (or fetched) once a marker actually asks for it.
+    asad_lookup = _LazyAsad(asad_path) if asad_path else None
+    markers = enrich_marker_texts(markers, corpus_entries, asad_lookup or {})
     markers = _map_reciter_to_markers(markers, reciter_segments)
     if manual_reciter_windows:
         markers = _apply_manual_reciter_windows_to_markers(markers, manual_reciter_windows)
     progress.end("enrich marker text + reciter mapping", t)
 
     t = progress.begin("write output JSON")
+    markers_detected = len(markers)
+    segment_detection = {
+        "audio_starts": len(audio_segment_starts),
+        "fatiha_starts": len(fatiha_segment_starts),
+        "merged_starts": len(reciter_segment_starts),
+    }
+    match_config = {
+        "min_score": match_min_score,
+        "min_overlap": match_min_overlap,
+        "min_confidence": match_min_confidence,
+        "min_gap_seconds": match_min_gap_seconds,
+        "strict_normalization": STRICT_NORMALIZATION,
+        "require_weak_support_for_inferred": match_require_weak_support_for_inferred,
+        "start_surah_number": effective_start_surah_number,
+        "start_ayah": effective_start_ayah,
+        "segment_constraints_count": len(match_constraints),
+        "matcher_mode": str(matcher_mode or "legacy"),
+    }
+    override_flags = {
+        "apply_day_final_ayah_override": bool(apply_day_final_ayah_override),
+        "apply_marker_time_overrides": bool(apply_marker_time_overrides),
+        "apply_override_surah_fill": bool(apply_override_surah_fill),
+    }
+    manual_reciter_windows_meta = [
+        {
+            "start_time": int(start),
+            "end_time": int(end),
+            "reciter": reciter,
+        }
+        for start, end, reciter in manual_reciter_windows
+    ]
     payload = {
         "day": day,
         "source": source,
@@ -1230,50 +1288,24 @@ def process_day(
             "audio_path": str(normalized_audio_path),
             "part": part,
             "whisper_model": whisper_model,
-            "markers_detected": len(markers),
+            "markers_detected": markers_detected,
             "transcript_segments_raw": len(transcript_segments),
             "transcript_segments_for_matching": len(transcript_for_matching),
             "transcript_reset_markers": len(reset_markers),
             "reciter_segments_detected": len(reciter_segments),
             "voice_reciter_classification_enabled": bool(use_voice_reciter_classification),
-            "manual_reciter_windows": [
-                {
-                    "start_time": int(start),
-                    "end_time": int(end),
-                    "reciter": reciter,
-                }
-                for start, end, reciter in manual_reciter_windows
-            ],
+            "manual_reciter_windows": manual_reciter_windows_meta,
             "corpus_loaded": bool(corpus_entries),
-            "asad_loaded": bool(asad_lookup),
+            "asad_loaded": bool(asad_lookup and asad_lookup.available),
             "transcript_path": str(transcript_cache_path),
             "asr_corrections": asr_corrections_info,
-            "segment_detection": {
-                "audio_starts": len(audio_segment_starts),
-                "fatiha_starts": len(fatiha_segment_starts),
-                "merged_starts": len(reciter_segment_starts),
-            },
+            "segment_detection": segment_detection,
             "reciter_filter": reciter_filter_info,
-            "match_config": {
-                "min_score": match_min_score,
-                "min_overlap": match_min_overlap,
-                "min_confidence": match_min_confidence,
-                "min_gap_seconds": match_min_gap_seconds,
-                "strict_normalization": STRICT_NORMALIZATION,
-                "require_weak_support_for_inferred": match_require_weak_support_for_inferred,
-                "start_surah_number": effective_start_surah_number,
-                "start_ayah": effective_start_ayah,
-                "segment_constraints_count": len(match_constraints),
-                "matcher_mode": str(matcher_mode or "legacy"),
-            },
+            "match_config": match_config,
             "manual_override": override_info,
             "marker_time_overrides": marker_time_overrides,
             "override_surah_fill": range_fill_info,
-            "override_flags": {
-                "apply_day_final_ayah_override": bool(apply_day_final_ayah_override),
-                "apply_marker_time_overrides": bool(apply_marker_time_overrides),
-                "apply_override_surah_fill": bool(apply_override_surah_fill),
-            },
+            "override_flags": override_flags,
             "pipeline_timings_seconds": progress.summary(),
         },
     }
@@ -1283,3 +1315,44 @@ def process_day(
     total_elapsed = progress.total_elapsed_seconds()
     print(f"[pipeline] complete in {total_elapsed:.1f}s", flush=True)
     return payload
+
+
+def _configured_day_workers() -> int:
+    configured = os.getenv("PIPELINE_DAY_WORKERS", "").strip()
+    try:
+        workers = int(configured)
+    except ValueError:
+        if configured:
+            print(f"[pipeline] ignoring invalid PIPELINE_DAY_WORKERS={configured!r}", flush=True)
+        return 1
+    return max(1, workers)
+
+
+def process_days(jobs: list[dict], max_workers: int | None = None) -> list[dict | None]:
+    # Each job holds the keyword arguments for one process_day call. Every worker prepares
+    # audio and loads its own whisper model, so days run one at a time unless asked.
+    # A failed day is reported and leaves None in its slot instead of discarding the rest.
+    if not jobs:
+        return []
+    if max_workers is None:
+        max_workers = _configured_day_workers()
+    workers = min(max_workers, len(jobs))
+    results: list[dict | None] = [None] * len(jobs)
+    if workers <= 1:
+        for index, kwargs in enumerate(jobs):
+            try:
+                results[index] = process_day(**kwargs)
+            except Exception:
+                print(f"[pipeline] job {index + 1}/{len(jobs)} failed:", flush=True)
+                traceback.print_exc()
+        return results
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        futures = {executor.submit(process_day, **kwargs): index for index, kwargs in enumerate(jobs)}
+        for future in as_completed(futures):
+            index = futures[future]
+            try:
+                results[index] = future.result()
+            except Exception:
+                print(f"[pipeline] job {index + 1}/{len(jobs)} failed:", flush=True)
+                traceback.print_exc()
+    return results
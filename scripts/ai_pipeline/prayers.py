@@ -19,19 +19,23 @@ def read_mono_audio(path: Path) -> tuple[np.ndarray, int]:
     return audio, int(sample_rate)
 
 
-def _find_runs(mask: np.ndarray) -> list[tuple[int, int]]:
+SILENCE_LEVEL = 0
+VOICE_LEVEL = 2
+
+
+def _find_runs(levels: np.ndarray, target: int) -> list[tuple[int, int]]:
     runs: list[tuple[int, int]] = []
     run_start: int | None = None
 
-    for index, value in enumerate(mask):
-        if value and run_start is None:
+    for index, value in enumerate(levels):
+        if value == target and run_start is None:
             run_start = index
-        elif not value and run_start is not None:
+        elif value != target and run_start is not None:
             runs.append((run_start, index - 1))
             run_start = None
 
     if run_start is not None:
-        runs.append((run_start, len(mask) - 1))
+        runs.append((run_start, len(levels) - 1))
 
     return runs
 
@@ -48,34 +52,46 @@ def detect_prayer_starts(
         return [0]
 
     seconds = len(audio) // sample_rate
-    trimmed = audio[: seconds * sample_rate]
-    frames = trimmed.reshape(seconds, sample_rate)
+    trimmed = np.ascontiguousarray(audio[: seconds * sample_rate], dtype=np.float32)
+    step = trimmed.strides[0]
+    frames = np.lib.stride_tricks.as_strided(
+        trimmed,
+        shape=(seconds, sample_rate),
+        strides=(step * sample_rate, step),
+        writeable=False,
+    )
 
-    rms = np.sqrt(np.mean(np.square(frames), axis=1))
-    smoothed = np.convolve(rms, np.ones(5, dtype=np.float32) / 5, mode="same")
+    rms = np.empty(seconds, dtype=np.float32)
+    np.einsum("ij,ij->i", frames, frames, dtype=np.float32, out=rms)
+    rms /= np.float32(sample_rate)
+    np.sqrt(rms, out=rms)
+    smoothed = np.convolve(rms, np.full(5, 0.2, dtype=np.float32), mode="same")
 
-    voice_threshold = np.percentile(smoothed, 40)
-    silence_threshold = np.percentile(smoothed, 20)
+    voice_threshold = np.float32(np.percentile(smoothed, 40))
+    silence_threshold = np.float32(np.percentile(smoothed, 20))
 
-    active = smoothed > voice_threshold
-    silence = smoothed < silence_threshold
+    # One pass buckets each second: below silence, in between, or strictly above voice.
+    levels = np.digitize(
+        smoothed,
+        [silence_threshold, np.nextafter(voice_threshold, np.float32(np.inf))],
+    ).astype(np.uint8)
 
     starts: list[int] = []
 
-    active_runs = _find_runs(active)
+    active_runs = _find_runs(levels, VOICE_LEVEL)
     if active_runs:
         starts.append(active_runs[0][0])
 
-    for start, end in _find_runs(silence):
+    for start, end in _find_runs(levels, SILENCE_LEVEL):
         run_length = end - start + 1
         if run_length < min_silence_seconds:
             continue
 
         next_index = end + 1
-        while next_index < len(active) and not active[next_index]:
+        while next_index < len(levels) and levels[next_index] != VOICE_LEVEL:
             next_index += 1
 
-        if next_index < len(active):
+        if next_index < len(levels):
             starts.append(next_index)
 
     deduped: list[int] = []
@@ -97,13 +113,12 @@ def build_prayer_segments(starts: list[int], total_seconds: int) -> list[PrayerS
         starts = [0]
 
     sorted_starts = sorted(starts)
-    segments: list[PrayerSegment] = []
+    tails = sorted_starts[1:] + [total_seconds]
 
-    for index, start in enumerate(sorted_starts):
-        end = sorted_starts[index + 1] if index + 1 < len(sorted_starts) else total_seconds
-        segments.append(PrayerSegment(index=index + 1, start=int(start), end=int(max(start + 1, end))))
-
-    return segments
+    return [
+        PrayerSegment(index=index + 1, start=int(start), end=int(max(start + 1, end)))
+        for index, (start, end) in enumerate(zip(sorted_starts, tails))
+    ]
 
 
 def _normalize_arabic(text: str) -> str:
@@ -152,11 +167,12 @@ def detect_fatiha_starts(
     candidates: list[int] = []
 
     for segment in transcript_segments:
-        raw_text = getattr(segment, "text", None)
-        raw_start = getattr(segment, "start", None)
-        if raw_text is None and isinstance(segment, dict):
+        if isinstance(segment, dict):
             raw_text = segment.get("text")
             raw_start = segment.get("start")
+        else:
+            raw_text = getattr(segment, "text", None)
+            raw_start = getattr(segment, "start", None)
 
         text = _normalize_arabic(str(raw_text or ""))
         if len(text) < 12 or raw_start is None:
@@ -1,19 +1,36 @@
 from __future__ import annotations
 
-import json
+import heapq
 import os
 import re
-from dataclasses import dataclass
+from array import array
+from bisect import bisect_left, bisect_right
+from dataclasses import dataclass, field
+from functools import lru_cache
+from itertools import accumulate, groupby
+from operator import attrgetter
 from pathlib import Path
+from typing import Iterable, Sequence
 
+import numpy as np
 import requests
-from rapidfuzz import fuzz
+from rapidfuzz import fuzz, process
 
+from .io import read_json, read_json_bytes, write_json
 from .types import Marker, TranscriptSegment, TranscriptWord
 
+try:
+    from numba import njit
+
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
 ARABIC_DIACRITICS = re.compile(r"[\u0610-\u061A\u064B-\u065F\u0670\u06D6-\u06ED]")
 ARABIC_PUNCT = re.compile(r"[^\u0621-\u063A\u0641-\u064A\s]")
 MULTI_SPACE = re.compile(r"\s+")
+EXCLUDED_SURAH_PATTERN = re.compile(r"fatiha|faatiha|فاتحة")
+SURAH_NAME_STRIP = str.maketrans("", "", "- ")
 ARABIC_CHAR_MAP = str.maketrans(
     {
         "أ": "ا",
@@ -32,6 +49,27 @@ STRICT_NORMALIZATION = os.getenv("STRICT_NORMALIZATION", "false").strip().lower(
     "no",
     "off",
 }
+_DEFAULT_NORMALIZE_CACHE_SIZE = 200_000
+
+
+def _configured_normalize_cache_size() -> int | None:
+    # 0 disables normalization memoization; "none" leaves it unbounded.
+    configured = os.getenv("NORMALIZE_CACHE_SIZE", "").strip().lower()
+    if not configured:
+        return _DEFAULT_NORMALIZE_CACHE_SIZE
+    if configured == "none":
+        return None
+    try:
+        size = int(configured)
+    except ValueError:
+        size = -1
+    if size < 0:
+        print(f"[quran] ignoring invalid NORMALIZE_CACHE_SIZE={configured!r}", flush=True)
+        return _DEFAULT_NORMALIZE_CACHE_SIZE
+    return size
+
+
+NORMALIZE_CACHE_SIZE = _configured_normalize_cache_size()
 MUQATTAAT_SPOKEN_FORMS: dict[str, list[str]] = {
     "الم": ["الف لام ميم"],
     "المر": ["الف لام ميم را"],
@@ -48,6 +86,10 @@ MUQATTAAT_SPOKEN_FORMS: dict[str, list[str]] = {
     "ن": ["نون"],
 }
 MUQATTAAT_COMPACT_FORMS = set(MUQATTAAT_SPOKEN_FORMS.keys())
+WEAK_QUALITIES = frozenset({"inferred", "ambiguous"})
+STRONG_QUALITIES = frozenset({"high", "manual"})
+ANCHOR_QUALITIES = frozenset({"high", "ambiguous", "manual"})
+QUALITY_RANKS = {"manual": 4, "high": 3, "ambiguous": 2, "inferred": 1}
 FATIHA_HINTS = [
     "الحمد لله رب العالمين",
     "الرحمن الرحيم",
@@ -66,28 +108,28 @@ NON_RECITATION_HINTS = [
     "سبحان ربي الاعلى",
     "السلام عليكم ورحمة الله",
 ]
-FATIHA_HINTS_NORM: list[str] = []
-NON_RECITATION_HINTS_NORM: list[str] = []
-ARABIC_ANCHOR_STOPWORDS = {
-    "و",
-    "ف",
-    "ثم",
-    "لا",
-    "ما",
-    "من",
-    "في",
-    "على",
-    "الى",
-    "إلى",
-    "ب",
-    "الذي",
-    "الذين",
-    "هذا",
-    "ذلك",
-}
+ARABIC_ANCHOR_STOPWORDS = frozenset(
+    {
+        "و",
+        "ف",
+        "ثم",
+        "لا",
+        "ما",
+        "من",
+        "في",
+        "على",
+        "الى",
+        "إلى",
+        "ب",
+        "الذي",
+        "الذين",
+        "هذا",
+        "ذلك",
+    }
+)
 
 
-@dataclass
+@dataclass(slots=True)
 class AyahEntry:
     surah_number: int
     surah: str
@@ -95,17 +137,45 @@ class AyahEntry:
     text: str
     normalized: str
     match_forms: list[str]
+    form_tokens: tuple[tuple[str, ...], ...] = field(init=False, repr=False, compare=False)
+    token_count: int = field(init=False, repr=False, compare=False)
+    anchor_tokens: tuple[str, ...] = field(init=False, repr=False, compare=False)
+    anchor_set: frozenset[str] = field(init=False, repr=False, compare=False)
+    anchor_max_len: int = field(init=False, repr=False, compare=False)
+    form_content_tokens: tuple[frozenset[str], ...] = field(init=False, repr=False, compare=False)
+    is_muqattaat: bool = field(init=False, repr=False, compare=False)
+    is_excluded: bool = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        self.form_tokens = tuple(tuple(form.split()) for form in self.match_forms)
+        self.token_count = len(self.normalized.split())
+        # Match forms are spelling variants of one ayah and share most anchors; keep each once.
+        self.anchor_tokens = tuple(
+            dict.fromkeys(anchor for form in self.match_forms for anchor in _anchor_tokens_for_form(form))
+        )
+        self.anchor_set = frozenset(self.anchor_tokens)
+        self.anchor_max_len = max(map(len, self.anchor_tokens), default=0)
+        self.form_content_tokens = tuple(_tokens_without_stopwords(form) for form in self.match_forms)
+        self.is_muqattaat = self.ayah == 1 and self.normalized.replace(" ", "") in MUQATTAAT_COMPACT_FORMS
+        self.is_excluded = is_excluded_surah(self.surah)
 
 
-@dataclass
+def _index_mask(indices: Iterable[int]) -> int:
+    mask = 0
+    for index in indices:
+        mask |= 1 << index
+    return mask
+
+
+@dataclass(slots=True)
 class WordWindow:
     normalized_text: str
     start_time: float
     end_time: float
-    word_indices: list[int]
+    word_indices: tuple[int, ...]
 
 
-@dataclass
+@dataclass(slots=True)
 class CandidateEvidence:
     adjusted_score: float
     score: float
@@ -115,12 +185,16 @@ class CandidateEvidence:
     normalized_text: str
     start_time: float
     end_time: float
-    word_indices: list[int]
+    word_indices: tuple[int, ...]
     segment_start_index: int | None = None
     segment_end_index: int | None = None
+    word_mask: int = field(init=False, repr=False, compare=False)
 
+    def __post_init__(self) -> None:
+        self.word_mask = _index_mask(self.word_indices)
 
-@dataclass
+
+@dataclass(slots=True)
 class TokenAlignmentResult:
     start_time: int
     end_time: int
@@ -129,30 +203,35 @@ class TokenAlignmentResult:
 
 
 def is_excluded_surah(surah: str) -> bool:
-    normalized = surah.casefold().replace("-", "").replace(" ", "")
-    return "fatiha" in normalized or "faatiha" in normalized or "فاتحة" in surah
+    return EXCLUDED_SURAH_PATTERN.search(surah.translate(SURAH_NAME_STRIP).casefold()) is not None
 
 
 def normalize_arabic(text: str, strict: bool | None = None) -> str:
     if strict is None:
         strict = STRICT_NORMALIZATION
+    return _normalize_arabic_cached(text, bool(strict))
+
 
+@lru_cache(maxsize=NORMALIZE_CACHE_SIZE)
+def _normalize_arabic_cached(text: str, strict: bool) -> str:
     text = ARABIC_DIACRITICS.sub("", text)
     if not strict:
         text = text.translate(ARABIC_CHAR_MAP)
         text = text.replace("ـ", "")
     text = ARABIC_PUNCT.sub(" ", text)
     text = MULTI_SPACE.sub(" ", text).strip()
-    if not strict and text:
-        tokens = text.split()
-        collapsed: list[str] = []
-        for token in tokens:
-            if not collapsed or token != collapsed[-1]:
-                collapsed.append(token)
-        text = " ".join(collapsed)
+    if not strict and " " in text:
+        tokens = text.split(" ")
+        if any(left == right for left, right in zip(tokens, tokens[1:])):
+            text = " ".join(token for index, token in enumerate(tokens) if index == 0 or token != tokens[index - 1])
     return text
 
 
+FATIHA_HINTS_NORM: list[str] = [normalize_arabic(text, strict=False) for text in FATIHA_HINTS]
+NON_RECITATION_HINTS_NORM: list[str] = [normalize_arabic(text, strict=False) for text in NON_RECITATION_HINTS]
+FATIHA_LONG_HINT_MASK = np.array([len(phrase) >= 18 for phrase in FATIHA_HINTS_NORM], dtype=bool)
+
+
 def _word_text(word: TranscriptWord | dict) -> str:
     if isinstance(word, dict):
         return str(word.get("text", "")).strip()
@@ -171,18 +250,51 @@ def _word_end(word: TranscriptWord | dict, fallback: float) -> float:
     return float(getattr(word, "end", fallback))
 
 
+def _cached_normalized_text(item: object, text: str) -> str:
+    # Transcript words/segments are revisited by many passes; keep the normalized
+    # form on the object, keyed by the exact text it was derived from.
+    cache = getattr(item, "__dict__", None)
+    if cache is None:
+        return normalize_arabic(text, strict=False)
+    cached = cache.get("_normalized_text")
+    if cached is not None and cached[0] is text:
+        return cached[1]
+    normalized = normalize_arabic(text, strict=False)
+    cache["_normalized_text"] = (text, normalized)
+    return normalized
+
+
+def _word_fields(word: TranscriptWord | dict) -> tuple[str, float, float]:
+    # (normalized text, start, end), materialized once per word object.
+    if isinstance(word, dict):
+        start = _word_start(word, fallback=0.0)
+        return normalize_arabic(_word_text(word), strict=False), start, _word_end(word, fallback=start)
+    text = str(getattr(word, "text", "") or "")
+    cache = getattr(word, "__dict__", None)
+    cached = cache.get("_word_fields") if cache is not None else None
+    if cached is not None and cached[0] is text:
+        return cached[1]
+    start = float(getattr(word, "start", 0.0))
+    fields = (normalize_arabic(text, strict=False), start, float(getattr(word, "end", start)))
+    if cache is not None:
+        cache["_word_fields"] = (text, fields)
+    return fields
+
+
+def _normalized_segment_text(segment: TranscriptSegment) -> str:
+    return _cached_normalized_text(segment, str(segment.text or ""))
+
+
 def generate_word_windows(
-    segment_words: list[TranscriptWord | dict],
+    segment_words: Sequence[TranscriptWord | dict],
     min_window: int = 4,
     max_window: int = 8,
 ):
     normalized_words: list[tuple[int, str, float, float]] = []
     for original_index, word in enumerate(segment_words):
-        text = normalize_arabic(_word_text(word), strict=False)
+        text, start, end = _word_fields(word)
         if not text:
             continue
-        start = _word_start(word, fallback=0.0)
-        end = _word_end(word, fallback=start)
         normalized_words.append((original_index, text, start, end))
 
     if min_window <= 0 or max_window <= 0:
@@ -193,34 +305,116 @@ def generate_word_windows(
     max_window = min(max_window, len(normalized_words))
     min_window = min(min_window, max_window)
 
+    # Words are already normalized, so joining them only needs the adjacent duplicate-token
+    # collapse normalize_arabic would apply across word boundaries.
+    # Every window is then a slice of one joined string: the first word's full text plus the
+    # continuations up to the window end, located through cumulative offsets.
+    texts = [item[1] for item in normalized_words]
+    pieces = [texts[0]]
+    for previous_text, text in zip(texts, texts[1:]):
+        head, _, rest = text.partition(" ")
+        continuation = rest if head == previous_text.rpartition(" ")[2] else text
+        pieces.append(f" {continuation}" if continuation else "")
+    joined = "".join(pieces)
+    offsets = list(accumulate(len(piece) for piece in pieces))
+    indices = tuple(item[0] for item in normalized_words)
+
     for window_size in range(min_window, max_window + 1):
         for left in range(0, len(normalized_words) - window_size + 1):
-            chunk = normalized_words[left : left + window_size]
-            normalized_text = normalize_arabic(" ".join(item[1] for item in chunk), strict=False)
-            if not normalized_text:
-                continue
+            right = left + window_size - 1
             yield WordWindow(
-                normalized_text=normalized_text,
-                start_time=chunk[0][2],
-                end_time=chunk[-1][3],
-                word_indices=[item[0] for item in chunk],
+                normalized_text=texts[left] + joined[offsets[left] : offsets[right]],
+                start_time=normalized_words[left][2],
+                end_time=normalized_words[right][3],
+                word_indices=indices[left : right + 1],
             )
 
 
+def _segment_words(segment: TranscriptSegment) -> tuple[TranscriptWord, ...]:
+    # Immutable snapshot of the segment's words, taken once instead of copied on every alignment.
+    words = getattr(segment, "words", None) or ()
+    cache = getattr(segment, "__dict__", None)
+    if cache is None:
+        return tuple(words)
+    cached = cache.get("_words_tuple")
+    if cached is None or cached[0] is not words or len(cached[1]) != len(words):
+        cached = (words, tuple(words))
+        cache["_words_tuple"] = cached
+    return cached[1]
+
+
+def _segment_word_windows(segment: TranscriptSegment, min_window: int = 4, max_window: int = 8) -> list[WordWindow]:
+    # Windows depend only on the segment's words, so build them once per (segment, bounds)
+    # instead of once per candidate ayah.
+    words = getattr(segment, "words", None) or []
+    cache = getattr(segment, "__dict__", None)
+    if cache is None:
+        return list(generate_word_windows(words, min_window=min_window, max_window=max_window))
+    cached = cache.get("_word_windows")
+    if cached is None or cached[0] is not words or cached[1] != len(words):
+        cached = (words, len(words), {})
+        cache["_word_windows"] = cached
+    bounds = (min_window, max_window)
+    windows = cached[2].get(bounds)
+    if windows is None:
+        windows = list(generate_word_windows(_segment_words(segment), min_window=min_window, max_window=max_window))
+        cached[2][bounds] = windows
+    return windows
+
+
 def _window_penalty(window_size: int) -> float:
     if window_size >= 8:
         return 0.0
     return max(0.0, float(8 - window_size) * 0.35)
 
 
-def _token_similarity(token_a: str, token_b: str) -> float:
-    if not token_a or not token_b:
-        return 0.0
-    partial = float(fuzz.partial_ratio(token_a, token_b))
-    return partial / 100.0
+MOVE_DIAG = 0
+MOVE_UP = 1
+MOVE_LEFT = 2
+
+
+def _fill_alignment_moves(gains, m: int, n: int, gap_penalty: float, scores, moves) -> None:
+    # Flat row-major layout: cell (i, j) lives at i * width + j.
+    # Plain index arithmetic only, so the same body runs on array/bytearray buffers or under numba.
+    width = n + 1
+    scores[0] = 0.0
+    moves[0] = MOVE_DIAG
+    for j in range(1, width):
+        scores[j] = j * gap_penalty
+        moves[j] = MOVE_LEFT
+
+    for i in range(1, m + 1):
+        row = i * width
+        previous_row = row - width
+        gain_row = (i - 1) * n
+        best = i * gap_penalty
+        scores[row] = best
+        moves[row] = MOVE_UP
+        for j in range(1, width):
+            diag = scores[previous_row + j - 1] + gains[gain_row + j - 1]
+            up = scores[previous_row + j] + gap_penalty
+            left = best + gap_penalty
+            if diag >= up and diag >= left:
+                best = diag
+                moves[row + j] = MOVE_DIAG
+            elif up >= left:
+                best = up
+                moves[row + j] = MOVE_UP
+            else:
+                best = left
+                moves[row + j] = MOVE_LEFT
+            scores[row + j] = best
+
 
+if NUMBA_AVAILABLE:
+    _fill_alignment_moves_jit = njit(cache=True)(_fill_alignment_moves)
 
-def _align_tokens(transcript_tokens: list[str], canonical_tokens: list[str]) -> tuple[list[list[int]], float, float]:
+
+def _align_tokens(
+    transcript_tokens: list[str],
+    canonical_tokens: list[str],
+    score_floor: float | None = None,
+) -> tuple[list[list[int]], float, float]:
     if not transcript_tokens or not canonical_tokens:
         return [], 0.0, 0.0
 
@@ -230,46 +424,41 @@ def _align_tokens(transcript_tokens: list[str], canonical_tokens: list[str]) ->
     mismatch_penalty = -0.55
     match_threshold = 0.62
 
-    scores = [[0.0] * (n + 1) for _ in range(m + 1)]
-    moves = [[""] * (n + 1) for _ in range(m + 1)]
-
-    for i in range(1, m + 1):
-        scores[i][0] = i * gap_penalty
-        moves[i][0] = "up"
-    for j in range(1, n + 1):
-        scores[0][j] = j * gap_penalty
-        moves[0][j] = "left"
-
-    for i in range(1, m + 1):
-        token_a = transcript_tokens[i - 1]
-        for j in range(1, n + 1):
-            token_b = canonical_tokens[j - 1]
-            similarity = _token_similarity(token_a, token_b)
-            diag_gain = similarity if similarity >= match_threshold else mismatch_penalty
-            diag = scores[i - 1][j - 1] + diag_gain
-            up = scores[i - 1][j] + gap_penalty
-            left = scores[i][j - 1] + gap_penalty
-            best = max(diag, up, left)
-            scores[i][j] = best
-            if best == diag:
-                moves[i][j] = "diag"
-            elif best == up:
-                moves[i][j] = "up"
-            else:
-                moves[i][j] = "left"
+    similarity = process.cdist(transcript_tokens, canonical_tokens, scorer=fuzz.partial_ratio, dtype=np.float64) / 100.0
+    matched = similarity >= match_threshold
+    if score_floor is not None:
+        # Each token pairs at most once, so coverage is capped by the rows/columns with any match
+        # and the average by the best single similarity; skip the DP when that cannot beat the floor.
+        if not matched.any():
+            return [], 0.0, 0.0
+        possible_pairs = min(int(matched.any(axis=1).sum()), int(matched.any(axis=0).sum()))
+        upper_bound = (0.6 * possible_pairs / min(m, n)) + (0.4 * float(similarity.max()))
+        if upper_bound + 1e-9 <= score_floor:
+            return [], 0.0, 0.0
+    gains = np.where(matched, similarity, mismatch_penalty)
+
+    width = n + 1
+    size = (m + 1) * width
+    if NUMBA_AVAILABLE:
+        move_buffer = np.zeros(size, dtype=np.uint8)
+        _fill_alignment_moves_jit(gains.ravel(), m, n, gap_penalty, np.empty(size, dtype=np.float64), move_buffer)
+        moves = move_buffer.tobytes()
+    else:
+        moves = bytearray(size)
+        _fill_alignment_moves(gains.ravel().tolist(), m, n, gap_penalty, array("d", bytes(8 * size)), moves)
 
     i = m
     j = n
     pairs: list[tuple[int, int, float]] = []
     while i > 0 or j > 0:
-        move = moves[i][j]
-        if move == "diag" and i > 0 and j > 0:
-            similarity = _token_similarity(transcript_tokens[i - 1], canonical_tokens[j - 1])
-            if similarity >= match_threshold:
-                pairs.append((i - 1, j - 1, similarity))
+        move = moves[i * width + j]
+        if move == MOVE_DIAG and i > 0 and j > 0:
+            score = float(similarity[i - 1, j - 1])
+            if score >= match_threshold:
+                pairs.append((i - 1, j - 1, score))
             i -= 1
             j -= 1
-        elif move == "up" and i > 0:
+        elif move == MOVE_UP and i > 0:
             i -= 1
         elif j > 0:
             j -= 1
@@ -287,30 +476,29 @@ def _align_tokens(transcript_tokens: list[str], canonical_tokens: list[str]) ->
 
 
 def _tokenize_transcript_words(
-    words: list[TranscriptWord],
+    words: Sequence[TranscriptWord],
     selected_indices: list[int] | None = None,
 ) -> tuple[list[str], list[float], list[float]]:
     if not words:
         return [], [], []
 
-    index_filter = set(selected_indices) if selected_indices else None
+    index_filter = _index_mask(selected_indices) if selected_indices else None
     tokens: list[str] = []
     starts: list[float] = []
     ends: list[float] = []
 
     for word_index, word in enumerate(words):
-        if index_filter is not None and word_index not in index_filter:
+        if index_filter is not None and not (index_filter >> word_index) & 1:
             continue
-        normalized = normalize_arabic(str(getattr(word, "text", "")), strict=False)
+        normalized, start, end = _word_fields(word)
         if not normalized:
             continue
-        pieces = [piece for piece in normalized.split() if piece]
+        pieces = normalized.split()
         if not pieces:
             continue
-        for piece in pieces:
-            tokens.append(piece)
-            starts.append(float(getattr(word, "start", 0.0)))
-            ends.append(float(getattr(word, "end", float(getattr(word, "start", 0.0)))))
+        tokens.extend(pieces)
+        starts.extend([start] * len(pieces))
+        ends.extend([end] * len(pieces))
 
     return tokens, starts, ends
 
@@ -331,14 +519,14 @@ def _collect_words_from_segments(
         segment = transcript_segments[index]
         if previous_end is not None and float(segment.start) - previous_end > max_gap_seconds:
             break
-        words.extend(list(getattr(segment, "words", None) or []))
+        words.extend(_segment_words(segment))
         previous_end = float(segment.end)
 
     return words
 
 
 def _align_entry_to_words(
-    words: list[TranscriptWord],
+    words: Sequence[TranscriptWord],
     entry: AyahEntry,
     selected_word_indices: list[int] | None = None,
 ) -> TokenAlignmentResult | None:
@@ -349,11 +537,14 @@ def _align_entry_to_words(
     best_alignment: TokenAlignmentResult | None = None
     best_score = -1.0
 
-    for form in entry.match_forms:
-        canonical_tokens = [token for token in form.split() if token]
+    for canonical_tokens in entry.form_tokens:
         if len(canonical_tokens) < 2:
             continue
-        mapping, avg_similarity, coverage = _align_tokens(transcript_tokens, canonical_tokens)
+        mapping, avg_similarity, coverage = _align_tokens(
+            transcript_tokens,
+            canonical_tokens,
+            score_floor=best_score if best_alignment is not None else None,
+        )
         if not mapping:
             continue
 
@@ -386,8 +577,7 @@ def _align_entry_to_segment_words(
     entry: AyahEntry,
     selected_word_indices: list[int] | None = None,
 ) -> TokenAlignmentResult | None:
-    words = list(getattr(segment, "words", None) or [])
-    return _align_entry_to_words(words=words, entry=entry, selected_word_indices=selected_word_indices)
+    return _align_entry_to_words(words=_segment_words(segment), entry=entry, selected_word_indices=selected_word_indices)
 
 
 def _resolve_marker_times(
@@ -450,33 +640,36 @@ def _candidate_confidence(score: float, rival_score: float, overlap: float) -> f
     return (0.55 * (score / 100.0)) + (0.25 * min(1.0, margin / 20.0)) + (0.2 * overlap)
 
 
-def _best_rival_score(
-    entry_candidates: dict[int, CandidateEvidence],
-    index: int,
-    excluded: set[int] | None = None,
-) -> float:
-    rival = -1.0
+def _top_two_scores(entry_candidates: dict[int, CandidateEvidence]) -> tuple[int, float, float]:
+    # (leader index, best score, runner-up score), so each candidate's best rival is read in O(1):
+    # the runner-up for the leader, the best score for everyone else.
+    top_index = -1
+    top_score = second_score = float("-inf")
     for candidate_index, evidence in entry_candidates.items():
-        if candidate_index == index:
-            continue
-        if excluded and candidate_index in excluded:
-            continue
-        if evidence.adjusted_score > rival:
-            rival = evidence.adjusted_score
-    return max(0.0, rival)
+        if evidence.adjusted_score > top_score:
+            second_score = top_score
+            top_score = evidence.adjusted_score
+            top_index = candidate_index
+        elif evidence.adjusted_score > second_score:
+            second_score = evidence.adjusted_score
+    return top_index, top_score, second_score
+
+
+def _rival_from_top_two(top_two: tuple[int, float, float], index: int, default: float) -> float:
+    top_index, top_score, second_score = top_two
+    rival = second_score if index == top_index else top_score
+    return rival if rival != float("-inf") else default
 
 
 def _word_windows_overlap_ambiguously(left: CandidateEvidence, right: CandidateEvidence) -> bool:
     if not left.word_indices or not right.word_indices:
         return True
 
-    left_set = set(left.word_indices)
-    right_set = set(right.word_indices)
-    overlap = len(left_set & right_set)
+    overlap = (left.word_mask & right.word_mask).bit_count()
     if overlap <= 0:
         return False
 
-    smaller = max(1, min(len(left_set), len(right_set)))
+    smaller = max(1, min(left.word_mask.bit_count(), right.word_mask.bit_count()))
     return (overlap / smaller) > 0.35
 
 
@@ -494,140 +687,215 @@ def _build_match_forms(ayah_number: int, normalized_text: str) -> list[str]:
 
 
 def _is_muqattaat_entry(entry: AyahEntry) -> bool:
-    if entry.ayah != 1:
-        return False
-    compact = entry.normalized.replace(" ", "")
-    return compact in MUQATTAAT_COMPACT_FORMS
+    return entry.is_muqattaat
+
+
+def _has_token_run(text_tokens: tuple[str, ...], form_tokens: tuple[str, ...], scanned: int = 0) -> bool:
+    # Only runs ending past the first `scanned` tokens are checked; earlier ones were seen already.
+    n = len(form_tokens)
+    for idx in range(max(0, scanned - n + 1), len(text_tokens) - n + 1):
+        if text_tokens[idx : idx + n] == form_tokens:
+            return True
+    return False
 
 
 def _has_muqattaat_phrase_match(normalized_text: str, entry: AyahEntry) -> bool:
     if not normalized_text:
         return False
-    text_tokens = [token for token in normalized_text.split() if token]
+    text_tokens = tuple(normalized_text.split())
     if not text_tokens:
         return False
 
-    for form in entry.match_forms:
-        form_tokens = [token for token in form.split() if token]
+    for form, form_tokens in zip(entry.match_forms, entry.form_tokens):
         if not form_tokens:
             continue
 
         # Direct phrase/token sequence match is the strongest signal for muqatta'at.
-        n = len(form_tokens)
-        if n <= len(text_tokens):
-            for idx in range(0, len(text_tokens) - n + 1):
-                if text_tokens[idx : idx + n] == form_tokens:
-                    return True
+        if _has_token_run(text_tokens, form_tokens):
+            return True
 
         # Fallback: very high fuzzy similarity for short phrase transcripts.
-        if len(text_tokens) <= 14 and float(fuzz.token_set_ratio(normalized_text, form)) >= 95.0:
+        if len(text_tokens) <= 14 and fuzz.token_set_ratio(normalized_text, form, score_cutoff=95.0):
             return True
 
     return False
 
 
-def _score_segment_against_entry(normalized_segment: str, entry: AyahEntry) -> tuple[float, float]:
+def _score_segment_against_entry(
+    normalized_segment: str,
+    entry: AyahEntry,
+    floor: float = -1.0,
+) -> tuple[float, float]:
+    # Scores at or above `floor` are exact; below it the caller only learns that the floor was
+    # missed, which lets rapidfuzz bail out of forms that cannot reach it.
     top_score = -1.0
     top_overlap = 0.0
-    for candidate in entry.match_forms:
-        token_set = float(fuzz.token_set_ratio(normalized_segment, candidate))
-        partial = float(fuzz.partial_ratio(normalized_segment, candidate))
+    token_set_cutoff = max(0.0, (floor - 25.0) / 0.75 - 1e-6)
+    for candidate, candidate_tokens in zip(entry.match_forms, entry.form_content_tokens):
+        token_set = float(fuzz.token_set_ratio(normalized_segment, candidate, score_cutoff=token_set_cutoff))
+        # partial_ratio is the costly half; skip it, or let rapidfuzz bail early, when even a
+        # perfect partial score could not lift this form above the best one so far or the floor.
+        if (0.75 * token_set) + 25.0 <= top_score or (0.75 * token_set) + 25.0 < floor:
+            continue
+        partial_cutoff = max(0.0, (max(top_score, floor) - (0.75 * token_set)) / 0.25 - 1e-6)
+        partial = float(fuzz.partial_ratio(normalized_segment, candidate, score_cutoff=partial_cutoff))
         score = (0.75 * token_set) + (0.25 * partial)
         if score > top_score:
             top_score = score
-            top_overlap = _token_overlap(normalized_segment, candidate)
+            top_overlap = _token_set_overlap(_tokens_without_stopwords(normalized_segment), candidate_tokens)
     return top_score, top_overlap
 
 
-def _anchor_tokens_for_form(form: str) -> list[str]:
-    tokens = [token for token in form.split() if token]
+@lru_cache(maxsize=None)
+def _anchor_tokens_for_form(form: str) -> tuple[str, ...]:
+    tokens = tuple(token for token in form.split() if token)
     if not tokens:
-        return []
+        return ()
 
-    strong = [token for token in tokens if len(token) >= 4 and token not in ARABIC_ANCHOR_STOPWORDS]
+    strong = tuple(token for token in tokens if len(token) >= 4 and token not in ARABIC_ANCHOR_STOPWORDS)
     if strong:
         return strong
 
-    medium = [token for token in tokens if len(token) >= 3]
+    medium = tuple(token for token in tokens if len(token) >= 3)
     if medium:
         return medium
 
     return tokens
 
 
+# Gap recovery and the refine passes rescore the same (segment text, ayah) pairs many times
+# within one matching run; match_quran_markers creates one of these per run and hands it down.
+SegmentScoreCache = dict[tuple[str, int, int], tuple[float, float]]
+_SEGMENT_SCORE_CACHE_LIMIT = 200_000
+
+
+def _cached_segment_score(
+    normalized_segment: str,
+    entry: AyahEntry,
+    score_cache: SegmentScoreCache | None,
+) -> tuple[float, float]:
+    if score_cache is None:
+        return _score_segment_against_entry(normalized_segment, entry)
+    key = (normalized_segment, entry.surah_number, entry.ayah)
+    cached = score_cache.get(key)
+    if cached is None:
+        if len(score_cache) >= _SEGMENT_SCORE_CACHE_LIMIT:
+            score_cache.clear()
+        cached = _score_segment_against_entry(normalized_segment, entry)
+        score_cache[key] = cached
+    return cached
+
+
 def _estimate_marker_onset_time(segment: TranscriptSegment, entry: AyahEntry) -> int:
-    words = getattr(segment, "words", None) or []
+    words = _segment_words(segment)
     if not words:
         return int(round(segment.start))
 
     best_time: float | None = None
-    best_score = -1.0
+    word_rows = [(text, start) for text, start, _ in map(_word_fields, words) if text]
 
     for form in entry.match_forms:
         anchors = _anchor_tokens_for_form(form)
         if not anchors:
             continue
 
-        for word in words:
-            normalized_word = normalize_arabic(str(getattr(word, "text", "")), strict=False)
-            if not normalized_word:
-                continue
-
-            local_score = max(
-                max(float(fuzz.ratio(normalized_word, anchor)), float(fuzz.partial_ratio(normalized_word, anchor)))
+        for normalized_word, word_start in word_rows:
+            # score_cutoff lets rapidfuzz bail out early; any anchor at 80+ is a hit.
+            if any(
+                fuzz.ratio(normalized_word, anchor, score_cutoff=80)
+                or fuzz.partial_ratio(normalized_word, anchor, score_cutoff=80)
                 for anchor in anchors
-            )
-            if local_score >= 80:
-                word_start = float(getattr(word, "start", segment.start))
+            ):
                 if best_time is None or word_start < best_time:
                     best_time = word_start
-                if local_score > best_score:
-                    best_score = local_score
 
     return int(round(best_time if best_time is not None else segment.start))
 
 
-def _is_fatiha_like_segment(normalized_segment: str, min_score: int = 90) -> bool:
-    global FATIHA_HINTS_NORM
+def _fatiha_hint_scores(
+    normalized_segments: list[str],
+    min_score: int = 90,
+    workers: int = 1,
+) -> list[np.ndarray | None]:
+    rows: list[np.ndarray | None] = [None] * len(normalized_segments)
+    eligible = [index for index, text in enumerate(normalized_segments) if 10 <= len(text) <= 80]
+    if eligible:
+        matrix = process.cdist(
+            [normalized_segments[index] for index in eligible],
+            FATIHA_HINTS_NORM,
+            scorer=fuzz.partial_ratio,
+            dtype=np.float64,
+            score_cutoff=min_score - 6,
+            workers=workers,
+        )
+        for index, row in zip(eligible, matrix):
+            rows[index] = row
+    return rows
+
+
+def _non_recitation_hint_scores(
+    normalized_segments: list[str],
+    min_score: int = 95,
+    workers: int = 1,
+) -> list[np.ndarray | None]:
+    rows: list[np.ndarray | None] = [None] * len(normalized_segments)
+    eligible = [index for index, text in enumerate(normalized_segments) if 4 <= len(text) <= 48]
+    if eligible:
+        matrix = process.cdist(
+            [normalized_segments[index] for index in eligible],
+            NON_RECITATION_HINTS_NORM,
+            scorer=fuzz.partial_ratio,
+            dtype=np.float64,
+            score_cutoff=min_score,
+            workers=workers,
+        )
+        for index, row in zip(eligible, matrix):
+            rows[index] = row
+    return rows
+
+
+def _is_fatiha_like_segment(
+    normalized_segment: str,
+    min_score: int = 90,
+    hint_scores: np.ndarray | None = None,
+) -> bool:
     if len(normalized_segment) < 10:
         return False
     if len(normalized_segment) > 80:
         return False
 
-    if not FATIHA_HINTS_NORM:
-        FATIHA_HINTS_NORM = [normalize_arabic(text, strict=False) for text in FATIHA_HINTS]
-
-    scores = [float(fuzz.partial_ratio(normalized_segment, phrase)) for phrase in FATIHA_HINTS_NORM]
-    if not scores:
-        return False
+    if hint_scores is None:
+        hint_scores = _fatiha_hint_scores([normalized_segment], min_score=min_score)[0]
 
-    medium_hits = sum(score >= (min_score - 6) for score in scores)
-    long_hit = any(len(phrase) >= 18 and score >= (min_score - 2) for phrase, score in zip(FATIHA_HINTS_NORM, scores))
+    medium_hits = int(np.count_nonzero(hint_scores >= (min_score - 6)))
+    long_hit = bool(np.any(FATIHA_LONG_HINT_MASK & (hint_scores >= (min_score - 2))))
     return long_hit or medium_hits >= 2
 
 
-def _is_non_recitation_segment(normalized_segment: str, min_score: int = 95) -> bool:
-    global NON_RECITATION_HINTS_NORM
+def _is_non_recitation_segment(
+    normalized_segment: str,
+    min_score: int = 95,
+    hint_scores: np.ndarray | None = None,
+) -> bool:
     if len(normalized_segment) < 4:
         return False
     if len(normalized_segment) > 48:
         return False
-    tokens = [token for token in normalized_segment.split() if token]
+    tokens = normalized_segment.split()
     if len(tokens) > 6:
         return False
 
-    if not NON_RECITATION_HINTS_NORM:
-        NON_RECITATION_HINTS_NORM = [normalize_arabic(text, strict=False) for text in NON_RECITATION_HINTS]
-
+    if hint_scores is None:
+        hint_scores = _non_recitation_hint_scores([normalized_segment], min_score=min_score)[0]
+    scores = hint_scores.tolist()
     best_score = 0.0
     best_overlap = 0.0
-    for phrase in NON_RECITATION_HINTS_NORM:
+    for phrase, score in zip(NON_RECITATION_HINTS_NORM, scores):
         if normalized_segment == phrase:
             return True
         if normalized_segment in phrase or phrase in normalized_segment:
             if _token_overlap(normalized_segment, phrase) >= 0.7:
                 return True
-        score = float(fuzz.partial_ratio(normalized_segment, phrase))
         overlap = _token_overlap(normalized_segment, phrase)
         if score > best_score:
             best_score = score
@@ -635,29 +903,51 @@ def _is_non_recitation_segment(normalized_segment: str, min_score: int = 95) ->
     return best_score >= float(min_score) and best_overlap >= 0.65
 
 
+def _script_char_counts(text: str) -> tuple[int, int]:
+    if len(text) < 64:
+        arabic_chars = sum(1 for ch in text if "\u0600" <= ch <= "\u06FF")
+        latin_chars = sum(1 for ch in text if "a" <= ch <= "z" or "A" <= ch <= "Z")
+        return arabic_chars, latin_chars
+    codes = np.frombuffer(text.encode("utf-32-le"), dtype=np.uint32)
+    arabic_chars = int(np.count_nonzero((codes >= 0x0600) & (codes <= 0x06FF)))
+    folded = codes | 0x20
+    latin_chars = int(np.count_nonzero((folded >= 0x61) & (folded <= 0x7A)))
+    return arabic_chars, latin_chars
+
+
 def clean_transcript_for_matching(
     transcript_segments: list[TranscriptSegment],
     min_arabic_chars: int = 2,
 ) -> list[TranscriptSegment]:
-    cleaned: list[TranscriptSegment] = []
+    candidates: list[tuple[TranscriptSegment, str]] = []
     for segment in transcript_segments:
         text = str(segment.text or "").strip()
         if not text:
             continue
 
-        normalized = normalize_arabic(text, strict=False)
-        if len(normalized) < 2:
+        # Character counts are far cheaper than normalization + fuzzy hint checks; reject on them first.
+        arabic_chars, latin_chars = _script_char_counts(text)
+        if arabic_chars < min_arabic_chars:
             continue
-        if _is_fatiha_like_segment(normalized):
+        if latin_chars > 0 and arabic_chars < (latin_chars * 2):
             continue
-        if _is_non_recitation_segment(normalized):
+
+        normalized = _normalized_segment_text(segment)
+        if len(normalized) < 2:
             continue
+        candidates.append((segment, normalized))
 
-        arabic_chars = sum(1 for ch in text if "\u0600" <= ch <= "\u06FF")
-        latin_chars = sum(1 for ch in text if ("a" <= ch.lower() <= "z"))
-        if arabic_chars < min_arabic_chars:
+    candidate_texts = [normalized for _, normalized in candidates]
+    # Whole-transcript sweeps are large enough to pay for rapidfuzz's worker threads.
+    fatiha_scores = _fatiha_hint_scores(candidate_texts, workers=-1)
+    non_recitation_scores = _non_recitation_hint_scores(candidate_texts, workers=-1)
+    cleaned: list[TranscriptSegment] = []
+    for (segment, normalized), fatiha_row, non_recitation_row in zip(
+        candidates, fatiha_scores, non_recitation_scores
+    ):
+        if _is_fatiha_like_segment(normalized, hint_scores=fatiha_row):
             continue
-        if latin_chars > 0 and arabic_chars < (latin_chars * 2):
+        if _is_non_recitation_segment(normalized, hint_scores=non_recitation_row):
             continue
 
         cleaned.append(segment)
@@ -665,30 +955,29 @@ def clean_transcript_for_matching(
 
 
 def detect_reset_markers_from_transcript(transcript_segments: list[TranscriptSegment]) -> list[float]:
-    strict_phrases = [normalize_arabic(text, strict=False) for text in NON_RECITATION_HINTS]
+    strict_phrases = NON_RECITATION_HINTS_NORM
 
     def is_strict_reset_phrase(normalized: str) -> bool:
-        tokens = [token for token in normalized.split() if token]
+        tokens = normalized.split()
         if not tokens or len(tokens) > 6:
             return False
         for phrase in strict_phrases:
             if normalized == phrase:
                 return True
-            phrase_tokens = [token for token in phrase.split() if token]
+            phrase_tokens = phrase.split()
             if abs(len(tokens) - len(phrase_tokens)) > 1:
                 continue
-            ratio = float(fuzz.ratio(normalized, phrase))
-            overlap = _token_overlap(normalized, phrase)
-            if ratio >= 97.0 and overlap >= 0.85:
+            if fuzz.ratio(normalized, phrase, score_cutoff=97.0) and _token_overlap(normalized, phrase) >= 0.85:
                 return True
         return False
 
+    normalized_texts = [_normalized_segment_text(segment) for segment in transcript_segments]
+    fatiha_scores = _fatiha_hint_scores(normalized_texts, workers=-1)
     reset_points: list[float] = []
-    for segment in transcript_segments:
-        normalized = normalize_arabic(str(segment.text or ""), strict=False)
+    for segment, normalized, hint_scores in zip(transcript_segments, normalized_texts, fatiha_scores):
         if not normalized:
             continue
-        if _is_fatiha_like_segment(normalized) or is_strict_reset_phrase(normalized):
+        if _is_fatiha_like_segment(normalized, hint_scores=hint_scores) or is_strict_reset_phrase(normalized):
             reset_points.append(float(segment.start))
     return sorted(dict.fromkeys(reset_points))
 
@@ -717,6 +1006,8 @@ def _recover_missing_gap_with_search(
     require_weak_support_for_inferred: bool,
     search_floor_time: int | None = None,
     exhaustive_ahead_search: bool = False,
+    score_cache: SegmentScoreCache | None = None,
+    time_index: SegmentTimeIndex | None = None,
 ) -> list[Marker]:
     recovered: list[Marker] = []
     window_start_limit = left.time + min_gap_seconds
@@ -759,6 +1050,8 @@ def _recover_missing_gap_with_search(
             min_confidence=max(0.50 if exhaustive_ahead_search else 0.56, min_confidence - 0.10),
             ambiguous_min_score=max(64 if exhaustive_ahead_search else 68, ambiguous_min_score - 6),
             ambiguous_min_confidence=max(0.46 if exhaustive_ahead_search else 0.50, ambiguous_min_confidence - 0.02),
+            score_cache=score_cache,
+            time_index=time_index,
         )
         if best is None:
             continue
@@ -774,6 +1067,8 @@ def _recover_missing_gap_with_search(
                 window_end=min(window_end_limit, matched_time + 14),
                 min_score=max(62, ambiguous_min_score - 8),
                 min_overlap=max(0.08, min_overlap - 0.06),
+                score_cache=score_cache,
+                time_index=time_index,
             ):
                 continue
 
@@ -797,9 +1092,16 @@ def _recover_missing_gap_with_search(
     return recovered
 
 
+@lru_cache(maxsize=100_000)
+def _tokens_without_stopwords(text: str) -> frozenset[str]:
+    return frozenset(token for token in text.split() if token and token not in ARABIC_ANCHOR_STOPWORDS)
+
+
 def _token_overlap(query: str, reference: str) -> float:
-    query_tokens = {token for token in query.split() if token and token not in ARABIC_ANCHOR_STOPWORDS}
-    reference_tokens = {token for token in reference.split() if token and token not in ARABIC_ANCHOR_STOPWORDS}
+    return _token_set_overlap(_tokens_without_stopwords(query), _tokens_without_stopwords(reference))
+
+
+def _token_set_overlap(query_tokens: frozenset[str], reference_tokens: frozenset[str]) -> float:
     if not query_tokens or not reference_tokens:
         return 0.0
 
@@ -811,13 +1113,14 @@ def _refine_marker_boundaries_with_neighbors(
     markers: list[Marker],
     transcript_segments: list[TranscriptSegment],
     entry_lookup: dict[tuple[str, int], AyahEntry],
+    score_cache: SegmentScoreCache | None = None,
 ) -> list[Marker]:
     if not markers or not transcript_segments:
         return markers
 
     segment_rows: list[tuple[float, float, str]] = []
     for segment in transcript_segments:
-        normalized = normalize_arabic(segment.text, strict=False)
+        normalized = _normalized_segment_text(segment)
         if not normalized:
             continue
         segment_rows.append((float(segment.start), float(segment.end), normalized))
@@ -857,10 +1160,10 @@ def _refine_marker_boundaries_with_neighbors(
                 break
             if last_seg_end is not None and (last_seg_end - seg_end) > 3.5:
                 break
-            score_cur, overlap_cur = _score_segment_against_entry(seg_text, entry)
+            score_cur, overlap_cur = _cached_segment_score(seg_text, entry, score_cache)
             prev_score = -1.0
             if prev_entry is not None:
-                prev_score, _ = _score_segment_against_entry(seg_text, prev_entry)
+                prev_score, _ = _cached_segment_score(seg_text, prev_entry, score_cache)
             strong_hit = score_cur >= 74.0 and overlap_cur >= 0.16 and score_cur >= (prev_score + 4.0)
             weak_contiguous = score_cur >= 68.0 and overlap_cur >= 0.13 and score_cur >= (prev_score + 2.0)
             if not accepted_backfill and not strong_hit:
@@ -883,10 +1186,10 @@ def _refine_marker_boundaries_with_neighbors(
                 break
             if last_seg_start is not None and (seg_start - last_seg_start) > 3.5:
                 break
-            score_cur, overlap_cur = _score_segment_against_entry(seg_text, entry)
+            score_cur, overlap_cur = _cached_segment_score(seg_text, entry, score_cache)
             next_score = -1.0
             if next_entry is not None:
-                next_score, _ = _score_segment_against_entry(seg_text, next_entry)
+                next_score, _ = _cached_segment_score(seg_text, next_entry, score_cache)
             strong_hit = score_cur >= 72.0 and overlap_cur >= 0.14 and score_cur >= (next_score + 4.0)
             weak_contiguous = score_cur >= 67.0 and overlap_cur >= 0.12 and score_cur >= (next_score + 2.0)
             if not accepted_forward and not strong_hit:
@@ -958,7 +1261,7 @@ def _refine_marker_boundaries_with_neighbors(
             seg_start, seg_end, seg_text = segment_rows[seg_idx]
             if seg_start - float(marker.start_time or marker.time) > 140.0:
                 break
-            score_cur, overlap_cur = _score_segment_against_entry(seg_text, entry)
+            score_cur, overlap_cur = _cached_segment_score(seg_text, entry, score_cache)
             if not accepted_any and not (score_cur >= 70.0 and overlap_cur >= 0.12):
                 continue
             if accepted_any and not (score_cur >= 66.0 and overlap_cur >= 0.10):
@@ -980,12 +1283,39 @@ def _contains_fatiha_reset_between(reset_times: list[float], left: int, right: i
     return any(lo <= timestamp <= hi for timestamp in reset_times)
 
 
+# Sorted segment starts and running max of ends; match_quran_markers builds one per run
+# and hands it down next to the score cache.
+SegmentTimeIndex = tuple[list[float], list[float]]
+
+
+def _segment_time_index(transcript_segments: list[TranscriptSegment]) -> SegmentTimeIndex | None:
+    starts = [float(segment.start) for segment in transcript_segments]
+    if any(current < previous for previous, current in zip(starts, starts[1:])):
+        return None
+    # Running max of segment ends stays sorted even when individual segments overlap.
+    max_ends = list(accumulate((float(segment.end) for segment in transcript_segments), max))
+    return starts, max_ends
+
+
+def _segments_overlapping(
+    transcript_segments: list[TranscriptSegment],
+    start: float,
+    end: float,
+    time_index: SegmentTimeIndex | None = None,
+) -> range:
+    if time_index is None:
+        return range(len(transcript_segments))
+    starts, max_ends = time_index
+    return range(bisect_left(max_ends, start), bisect_right(starts, end))
+
+
 def _has_low_data_gap(
     transcript_segments: list[TranscriptSegment],
     start_time: int,
     end_time: int,
     max_silence_seconds: int = 20,
     min_density: float = 0.07,
+    time_index: SegmentTimeIndex | None = None,
 ) -> bool:
     if end_time <= start_time:
         return False
@@ -997,12 +1327,13 @@ def _has_low_data_gap(
         return False
 
     relevant: list[tuple[float, float]] = []
-    for segment in transcript_segments:
+    for segment_index in _segments_overlapping(transcript_segments, start, end, time_index):
+        segment = transcript_segments[segment_index]
         seg_start = float(segment.start)
         seg_end = float(segment.end)
         if seg_end < start or seg_start > end:
             continue
-        normalized = normalize_arabic(segment.text, strict=False)
+        normalized = _normalized_segment_text(segment)
         if len(normalized) < 3:
             continue
         relevant.append((max(start, seg_start), min(end, seg_end)))
@@ -1033,6 +1364,8 @@ def _has_weak_local_support(
     window_end: int,
     min_score: int = 62,
     min_overlap: float = 0.08,
+    score_cache: SegmentScoreCache | None = None,
+    time_index: SegmentTimeIndex | None = None,
 ) -> bool:
     if entry is None or window_end <= window_start:
         return False
@@ -1040,15 +1373,16 @@ def _has_weak_local_support(
 
     top_score = -1.0
     top_overlap = 0.0
-    for segment in transcript_segments:
+    for segment_index in _segments_overlapping(transcript_segments, window_start, window_end, time_index):
+        segment = transcript_segments[segment_index]
         if segment.end < window_start or segment.start > window_end:
             continue
-        normalized = normalize_arabic(segment.text, strict=False)
+        normalized = _normalized_segment_text(segment)
         if len(normalized) < 3:
             continue
         if is_muqattaat and not _has_muqattaat_phrase_match(normalized, entry):
             continue
-        score, overlap = _score_segment_against_entry(normalized, entry)
+        score, overlap = _cached_segment_score(normalized, entry, score_cache)
         if score > top_score:
             top_score = score
             top_overlap = overlap
@@ -1077,8 +1411,7 @@ def load_corpus(corpus_path: Path) -> list[AyahEntry]:
     if not corpus_path.exists():
         return []
 
-    with corpus_path.open("r", encoding="utf-8") as handle:
-        payload = json.load(handle)
+    payload = read_json(corpus_path)
 
     surahs = payload.get("surahs", [])
     entries: list[AyahEntry] = []
@@ -1135,8 +1468,7 @@ def _parse_translation_payload(payload: dict) -> tuple[dict[tuple[int, int], str
 
 def load_asad_translation(asad_path: Path) -> dict[tuple[int, int], str]:
     if asad_path.exists():
-        with asad_path.open("r", encoding="utf-8") as handle:
-            payload = json.load(handle)
+        payload = read_json(asad_path)
         lookup, _ = _parse_translation_payload(payload)
         if lookup:
             return lookup
@@ -1144,14 +1476,12 @@ def load_asad_translation(asad_path: Path) -> dict[tuple[int, int], str]:
     try:
         response = requests.get(ASAD_API_URL, timeout=45)
         response.raise_for_status()
-        payload = response.json()
+        payload = read_json_bytes(response.content)
         lookup, transformed = _parse_translation_payload(payload)
         if lookup:
-            asad_path.parent.mkdir(parents=True, exist_ok=True)
-            with asad_path.open("w", encoding="utf-8") as handle:
-                json.dump(transformed, handle, ensure_ascii=False, indent=2)
+            write_json(asad_path, transformed)
         return lookup
-    except requests.RequestException:
+    except (requests.RequestException, ValueError):
         return {}
 
 
@@ -1162,11 +1492,10 @@ def enrich_marker_texts(
 ) -> list[Marker]:
     if not markers:
         return markers
+    if all(marker.surah_number is None for marker in markers):
+        return markers
 
-    arabic_lookup: dict[tuple[int, int], str] = {}
-    for entry in corpus_entries:
-        arabic_lookup[(entry.surah_number, entry.ayah)] = entry.text
-
+    arabic_lookup = {(entry.surah_number, entry.ayah): entry.text for entry in corpus_entries}
     for marker in markers:
         if marker.surah_number is None:
             continue
@@ -1211,13 +1540,47 @@ JUZ_STARTS: list[tuple[int, int, int]] = [
 ]
 
 
+JUZ_START_KEYS: list[tuple[int, int]] = [(start_surah, start_ayah) for _, start_surah, start_ayah in JUZ_STARTS]
+
+
+@lru_cache(maxsize=None)
 def get_juz_for_ayah(surah_number: int, ayah_number: int) -> int:
-    for juz, start_surah, start_ayah in reversed(JUZ_STARTS):
-        if surah_number > start_surah:
-            return juz
-        if surah_number == start_surah and ayah_number >= start_ayah:
-            return juz
-    return 1
+    index = bisect_right(JUZ_START_KEYS, (surah_number, ayah_number)) - 1
+    return JUZ_STARTS[index][0] if index >= 0 else 1
+
+
+def _merged_segment_texts(
+    transcript_segments: list[TranscriptSegment],
+    seg_index: int,
+    max_offset: int = 5,
+    max_gap_seconds: float = 2.6,
+) -> list[tuple[int, str]]:
+    # (next index, combined normalized text) for each contiguous follower of a seed segment.
+    # The chain does not depend on the ayah being searched, so it is built once per seed.
+    segment = transcript_segments[seg_index]
+    cache = getattr(segment, "__dict__", None)
+    key = (len(transcript_segments), max_offset, max_gap_seconds)
+    cached = cache.get("_merged_texts") if cache is not None else None
+    if cached is not None and cached[0] is transcript_segments and cached[1] == key:
+        return cached[2]
+
+    chain: list[tuple[int, str]] = []
+    combined_text = _normalized_segment_text(segment)
+    previous_end = float(segment.end)
+    for next_idx in range(seg_index + 1, min(len(transcript_segments), seg_index + 1 + max_offset)):
+        next_segment = transcript_segments[next_idx]
+        if float(next_segment.start) - previous_end > max_gap_seconds:
+            break
+        next_normalized = _normalized_segment_text(next_segment)
+        if len(next_normalized) < 2:
+            break
+        combined_text = f"{combined_text} {next_normalized}"
+        chain.append((next_idx, combined_text))
+        previous_end = float(next_segment.end)
+
+    if cache is not None:
+        cache["_merged_texts"] = (transcript_segments, key, chain)
+    return chain
 
 
 def _find_best_ayah_timestamp(
@@ -1231,6 +1594,8 @@ def _find_best_ayah_timestamp(
     min_confidence: float,
     ambiguous_min_score: int,
     ambiguous_min_confidence: float,
+    score_cache: SegmentScoreCache | None = None,
+    time_index: SegmentTimeIndex | None = None,
 ) -> tuple[int, int, str, float] | None:
     if window_end <= window_start:
         return None
@@ -1243,18 +1608,19 @@ def _find_best_ayah_timestamp(
     top_overlap = 0.0
     is_muqattaat = _is_muqattaat_entry(entry)
 
-    for seg_index, segment in enumerate(transcript_segments):
+    for seg_index in _segments_overlapping(transcript_segments, window_start, window_end, time_index):
+        segment = transcript_segments[seg_index]
         if segment.end < window_start or segment.start > window_end:
             continue
 
-        normalized_segment = normalize_arabic(segment.text, strict=False)
+        normalized_segment = _normalized_segment_text(segment)
         if len(normalized_segment) < 10:
             continue
         if is_muqattaat and not _has_muqattaat_phrase_match(normalized_segment, entry):
             continue
 
         best_candidate: CandidateEvidence | None = None
-        score, overlap = _score_segment_against_entry(normalized_segment, entry)
+        score, overlap = _cached_segment_score(normalized_segment, entry, score_cache)
         if _has_anchor_token_hit(entry, normalized_segment):
             best_candidate = CandidateEvidence(
                 adjusted_score=score,
@@ -1265,38 +1631,49 @@ def _find_best_ayah_timestamp(
                 normalized_text=normalized_segment,
                 start_time=float(segment.start),
                 end_time=float(segment.end),
-                word_indices=[],
+                word_indices=(),
                 segment_start_index=seg_index,
                 segment_end_index=seg_index,
             )
 
         # Cross-segment full-ayah matching: merge nearby transcript chunks so long ayahs
         # can be aligned against the canonical ayah text, not just a short local segment.
-        combined_text = normalized_segment
-        previous_end = float(segment.end)
-        for offset in range(1, 6):
-            next_idx = seg_index + offset
-            if next_idx >= len(transcript_segments):
-                break
+        # Merged texts only ever append tokens, so a muqatta'at phrase run found once stays
+        # found and each step only needs to scan runs reaching into the new tail.
+        muqattaat_run_found = False
+        muqattaat_scanned = 0
+        # In a narrow window the follower already starts past window_end, so skip building the chain.
+        merged_texts = (
+            _merged_segment_texts(transcript_segments, seg_index)
+            if seg_index + 1 < len(transcript_segments)
+            and float(transcript_segments[seg_index + 1].start) <= window_end
+            else ()
+        )
+        for offset, (next_idx, combined_text) in enumerate(merged_texts, start=1):
             next_segment = transcript_segments[next_idx]
-            if float(next_segment.start) - previous_end > 2.6:
-                break
             if float(next_segment.start) > window_end:
                 break
-            next_normalized = normalize_arabic(next_segment.text, strict=False)
-            if len(next_normalized) < 2:
-                break
-
-            combined_text = f"{combined_text} {next_normalized}".strip()
-            if is_muqattaat and not _has_muqattaat_phrase_match(combined_text, entry):
-                previous_end = float(next_segment.end)
-                continue
+            if is_muqattaat and not muqattaat_run_found:
+                combined_tokens = tuple(combined_text.split())
+                muqattaat_run_found = any(
+                    form_tokens and _has_token_run(combined_tokens, form_tokens, muqattaat_scanned)
+                    for form_tokens in entry.form_tokens
+                )
+                muqattaat_scanned = len(combined_tokens)
+                if not muqattaat_run_found and not (
+                    combined_tokens
+                    and len(combined_tokens) <= 14
+                    and any(
+                        form_tokens and fuzz.token_set_ratio(combined_text, form, score_cutoff=95.0)
+                        for form, form_tokens in zip(entry.match_forms, entry.form_tokens)
+                    )
+                ):
+                    continue
             penalty = float(offset) * 0.45
-            merged_score, merged_overlap = _score_segment_against_entry(combined_text, entry)
+            merged_score, merged_overlap = _cached_segment_score(combined_text, entry, score_cache)
             has_anchor = _has_anchor_token_hit(entry, combined_text)
             adjusted = merged_score - penalty
             if not has_anchor and adjusted < float(max(64, min_score - 8)):
-                previous_end = float(next_segment.end)
                 continue
             if has_anchor:
                 adjusted += 2.0
@@ -1310,18 +1687,16 @@ def _find_best_ayah_timestamp(
                     normalized_text=combined_text,
                     start_time=float(segment.start),
                     end_time=float(next_segment.end),
-                    word_indices=[],
+                    word_indices=(),
                     segment_start_index=seg_index,
                     segment_end_index=next_idx,
                 )
-            previous_end = float(next_segment.end)
 
-        segment_windows = list(generate_word_windows(list(getattr(segment, "words", None) or []), min_window=4, max_window=8))
-        for window in segment_windows:
+        for window in _segment_word_windows(segment, min_window=4, max_window=8):
             if is_muqattaat and not _has_muqattaat_phrase_match(window.normalized_text, entry):
                 continue
             penalty = _window_penalty(len(window.word_indices))
-            window_score, window_overlap = _score_segment_against_entry(window.normalized_text, entry)
+            window_score, window_overlap = _cached_segment_score(window.normalized_text, entry, score_cache)
             has_anchor = _has_anchor_token_hit(entry, window.normalized_text)
             adjusted = window_score - penalty
             if not has_anchor and adjusted < float(max(64, min_score - 8)):
@@ -1338,7 +1713,7 @@ def _find_best_ayah_timestamp(
                     normalized_text=window.normalized_text,
                     start_time=window.start_time,
                     end_time=window.end_time,
-                    word_indices=list(window.word_indices),
+                    word_indices=window.word_indices,
                     segment_start_index=seg_index,
                     segment_end_index=seg_index,
                 )
@@ -1395,6 +1770,8 @@ def _try_wide_reground_before_infer(
     min_confidence: float,
     ambiguous_min_score: int,
     ambiguous_min_confidence: float,
+    score_cache: SegmentScoreCache | None = None,
+    time_index: SegmentTimeIndex | None = None,
 ) -> tuple[int, int, str, float] | None:
     if window_end <= window_start:
         return None
@@ -1409,27 +1786,30 @@ def _try_wide_reground_before_infer(
         min_confidence=max(0.48, min_confidence - 0.14),
         ambiguous_min_score=max(58, ambiguous_min_score - 12),
         ambiguous_min_confidence=max(0.42, ambiguous_min_confidence - 0.10),
+        score_cache=score_cache,
+        time_index=time_index,
     )
 
 
 def _quality_rank(quality: str | None) -> int:
-    if quality == "manual":
-        return 4
-    if quality == "high":
-        return 3
-    if quality == "ambiguous":
-        return 2
-    if quality == "inferred":
-        return 1
-    return 0
+    return QUALITY_RANKS.get(quality, 0)
+
+
+def _marker_order_key(item: Marker) -> tuple[int, int, int]:
+    return (item.time, item.surah_number or 0, item.ayah)
+
+
+def _surah_ayah_key(item: Marker) -> tuple[str, int, int]:
+    # Groups a timeline by surah while keeping each surah in ayah, then time, order.
+    return (item.surah, int(item.ayah), int(item.time))
 
 
 def _is_anchor_quality(quality: str | None) -> bool:
-    return quality in {"high", "ambiguous", "manual"}
+    return quality in ANCHOR_QUALITIES
 
 
 def _is_strong_anchor_marker(marker: Marker) -> bool:
-    if marker.quality not in {"high", "manual"}:
+    if marker.quality not in STRONG_QUALITIES:
         return False
     return float(marker.confidence or 0.0) >= 0.70
 
@@ -1455,7 +1835,7 @@ def _estimate_step_seconds(surah_markers: dict[int, Marker], default_step: int =
 def _estimated_ayah_duration_seconds(entry: AyahEntry | None) -> int:
     if entry is None:
         return 8
-    token_count = len([token for token in entry.normalized.split() if token])
+    token_count = entry.token_count
     # Rough pacing proxy from ayah length. Used as a floor for next-ayah onset.
     return max(6, min(95, int(round(token_count * 0.48))))
 
@@ -1473,6 +1853,8 @@ def _fill_surah_coverage_markers(
     max_one_sided_extrapolation_ayahs: int = 5,
     min_bridge_step_seconds: float = 4.0,
     max_bridge_step_seconds: float = 28.0,
+    score_cache: SegmentScoreCache | None = None,
+    time_index: SegmentTimeIndex | None = None,
 ) -> list[Marker]:
     surah_map: dict[str, dict[int, Marker]] = {}
     for marker in sorted(existing_markers, key=lambda m: m.time):
@@ -1493,6 +1875,7 @@ def _fill_surah_coverage_markers(
             continue
 
         known_ayahs = sorted(ayah_map.keys())
+        anchor_ayahs = [a for a in known_ayahs if _is_anchor_quality(ayah_map[a].quality)]
         min_ayah = known_ayahs[0]
         max_ayah = known_ayahs[-1]
         step_seconds = _estimate_step_seconds(ayah_map)
@@ -1501,14 +1884,12 @@ def _fill_surah_coverage_markers(
             if ayah in ayah_map:
                 continue
 
-            left_ayahs = [a for a in known_ayahs if a < ayah]
-            right_ayahs = [a for a in known_ayahs if a > ayah]
-            left_ayah = left_ayahs[-1] if left_ayahs else None
-            right_ayah = right_ayahs[0] if right_ayahs else None
-            left_anchor_ayahs = [a for a in left_ayahs if _is_anchor_quality(ayah_map[a].quality)]
-            right_anchor_ayahs = [a for a in right_ayahs if _is_anchor_quality(ayah_map[a].quality)]
-            left_anchor_ayah = left_anchor_ayahs[-1] if left_anchor_ayahs else None
-            right_anchor_ayah = right_anchor_ayahs[0] if right_anchor_ayahs else None
+            position = bisect_left(known_ayahs, ayah)
+            left_ayah = known_ayahs[position - 1] if position > 0 else None
+            right_ayah = known_ayahs[position] if position < len(known_ayahs) else None
+            anchor_position = bisect_left(anchor_ayahs, ayah)
+            left_anchor_ayah = anchor_ayahs[anchor_position - 1] if anchor_position > 0 else None
+            right_anchor_ayah = anchor_ayahs[anchor_position] if anchor_position < len(anchor_ayahs) else None
 
             inferred_time: int
             left_marker: Marker | None = None
@@ -1588,6 +1969,8 @@ def _fill_surah_coverage_markers(
                     window_end=window_end,
                     min_score=weak_support_score,
                     min_overlap=weak_support_overlap,
+                    score_cache=score_cache,
+                    time_index=time_index,
                 ):
                     continue
 
@@ -1615,22 +1998,33 @@ def _dedupe_by_local_time_window(markers: list[Marker], window_seconds: int = 90
 
     sorted_markers = sorted(markers, key=lambda marker: marker.time)
     deduped: list[Marker] = []
+    # A duplicate merges into the latest kept marker for its ayah unless some kept marker at or
+    # after it has fallen out of the window. Kept times only grow, so once a marker falls out it
+    # stays out; a min-heap of times tracks the highest stale index and a dict the latest index per ayah.
+    latest_index: dict[tuple[str, int], int] = {}
+    live_times: list[tuple[int, int]] = []
+    stale_boundary = -1
 
     for marker in sorted_markers:
-        merged = False
-        for index in range(len(deduped) - 1, -1, -1):
+        while live_times and marker.time - live_times[0][0] > window_seconds:
+            time, index = heapq.heappop(live_times)
+            if deduped[index].time == time:
+                stale_boundary = max(stale_boundary, index)
+
+        key = (marker.surah, marker.ayah)
+        index = latest_index.get(key, -1)
+        if index > stale_boundary:
             candidate = deduped[index]
-            if marker.time - candidate.time > window_seconds:
-                break
-            if marker.surah == candidate.surah and marker.ayah == candidate.ayah:
-                if _quality_rank(marker.quality) > _quality_rank(candidate.quality):
-                    deduped[index] = marker
-                elif _quality_rank(marker.quality) == _quality_rank(candidate.quality) and marker.time < candidate.time:
-                    deduped[index] = marker
-                merged = True
-                break
-        if not merged:
-            deduped.append(marker)
+            if _quality_rank(marker.quality) > _quality_rank(candidate.quality) or (
+                _quality_rank(marker.quality) == _quality_rank(candidate.quality) and marker.time < candidate.time
+            ):
+                deduped[index] = marker
+                heapq.heappush(live_times, (marker.time, index))
+            continue
+
+        latest_index[key] = len(deduped)
+        heapq.heappush(live_times, (marker.time, len(deduped)))
+        deduped.append(marker)
 
     return deduped
 
@@ -1643,9 +2037,9 @@ def _apply_overlap_conflict_resolution(markers: list[Marker]) -> list[Marker]:
         return float(marker.confidence or 0.0)
 
     def is_strong(marker: Marker) -> bool:
-        return marker.quality in {"high", "manual"} or confidence(marker) >= 0.72
+        return marker.quality in STRONG_QUALITIES or confidence(marker) >= 0.72
 
-    ordered = sorted(markers, key=lambda item: (item.time, item.surah_number or 0, item.ayah))
+    ordered = sorted(markers, key=_marker_order_key)
     resolved: list[Marker] = []
     for idx, marker in enumerate(ordered):
         if not resolved:
@@ -1699,11 +2093,13 @@ def _refine_weak_boundary_markers(
     min_confidence: float,
     ambiguous_min_score: int,
     ambiguous_min_confidence: float,
+    score_cache: SegmentScoreCache | None = None,
+    time_index: SegmentTimeIndex | None = None,
 ) -> list[Marker]:
     if len(markers) < 3:
         return markers
 
-    ordered = sorted(markers, key=lambda item: (item.time, item.surah_number or 0, item.ayah))
+    ordered = sorted(markers, key=_marker_order_key)
 
     for idx in range(1, len(ordered) - 1):
         marker = ordered[idx]
@@ -1716,7 +2112,7 @@ def _refine_weak_boundary_markers(
             continue
         if next_marker.ayah <= marker.ayah:
             continue
-        if marker.quality not in {"ambiguous", "inferred"}:
+        if marker.quality not in WEAK_QUALITIES:
             continue
 
         marker_conf = float(marker.confidence or 0.0)
@@ -1753,6 +2149,8 @@ def _refine_weak_boundary_markers(
             min_confidence=min_confidence,
             ambiguous_min_score=ambiguous_min_score,
             ambiguous_min_confidence=ambiguous_min_confidence,
+            score_cache=score_cache,
+            time_index=time_index,
         )
         if best is None:
             continue
@@ -1781,6 +2179,21 @@ def _refine_weak_boundary_markers(
     return ordered
 
 
+def _same_surah_neighbour_indices(ordered: list[Marker]) -> tuple[list[int], list[int]]:
+    # Nearest earlier/later index with the same surah for every marker (-1 when none), in one sweep each way.
+    previous_index = [-1] * len(ordered)
+    next_index = [-1] * len(ordered)
+    last_seen: dict[str, int] = {}
+    for idx, marker in enumerate(ordered):
+        previous_index[idx] = last_seen.get(marker.surah, -1)
+        last_seen[marker.surah] = idx
+    last_seen.clear()
+    for idx in range(len(ordered) - 1, -1, -1):
+        next_index[idx] = last_seen.get(ordered[idx].surah, -1)
+        last_seen[ordered[idx].surah] = idx
+    return previous_index, next_index
+
+
 def _refine_inferred_markers_with_local_search(
     markers: list[Marker],
     transcript_segments: list[TranscriptSegment],
@@ -1791,11 +2204,14 @@ def _refine_inferred_markers_with_local_search(
     min_confidence: float,
     ambiguous_min_score: int,
     ambiguous_min_confidence: float,
+    score_cache: SegmentScoreCache | None = None,
+    time_index: SegmentTimeIndex | None = None,
 ) -> list[Marker]:
     if len(markers) < 3:
         return markers
 
-    ordered = sorted(markers, key=lambda item: (item.time, item.surah_number or 0, item.ayah))
+    ordered = sorted(markers, key=_marker_order_key)
+    previous_same_surah, next_same_surah = _same_surah_neighbour_indices(ordered)
 
     for idx, marker in enumerate(ordered):
         if marker.quality != "inferred":
@@ -1805,16 +2221,8 @@ def _refine_inferred_markers_with_local_search(
         if entry is None:
             continue
 
-        prev_marker: Marker | None = None
-        next_marker: Marker | None = None
-        for left in range(idx - 1, -1, -1):
-            if ordered[left].surah == marker.surah:
-                prev_marker = ordered[left]
-                break
-        for right in range(idx + 1, len(ordered)):
-            if ordered[right].surah == marker.surah:
-                next_marker = ordered[right]
-                break
+        prev_marker = ordered[previous_same_surah[idx]] if previous_same_surah[idx] >= 0 else None
+        next_marker = ordered[next_same_surah[idx]] if next_same_surah[idx] >= 0 else None
 
         current_time = int(marker.start_time or marker.time)
         if prev_marker is not None:
@@ -1847,6 +2255,8 @@ def _refine_inferred_markers_with_local_search(
             min_confidence=max(0.56, min_confidence - 0.08),
             ambiguous_min_score=max(66, ambiguous_min_score - 4),
             ambiguous_min_confidence=max(0.48, ambiguous_min_confidence - 0.04),
+            score_cache=score_cache,
+            time_index=time_index,
         )
         if best is None:
             continue
@@ -1877,11 +2287,44 @@ def _refine_inferred_markers_with_local_search(
     return ordered
 
 
+def _marker_starts(ordered: list[Marker]) -> list[int]:
+    # Start-second projection aligned with `ordered`; callers keep it in step when they move a start.
+    return [int(marker.start_time or marker.time) for marker in ordered]
+
+
+def _marker_quality_ranks(ordered: list[Marker]) -> list[int]:
+    # _quality_rank codes aligned with `ordered`: 1/2 are the weak qualities, 3/4 the anchors.
+    return [_quality_rank(marker.quality) for marker in ordered]
+
+
+def _surah_positions(ordered: list[Marker]) -> dict[str, list[int]]:
+    # Ascending positions in `ordered` per surah, so same-surah neighbour scans skip other surahs.
+    positions: dict[str, list[int]] = {}
+    for idx, marker in enumerate(ordered):
+        positions.setdefault(marker.surah, []).append(idx)
+    return positions
+
+
+def _next_higher_ayah_positions(ordered: list[Marker], surah_positions: dict[str, list[int]]) -> list[int]:
+    # Position of the first later same-surah marker with a higher ayah (-1 when none), via a monotonic stack.
+    next_higher = [-1] * len(ordered)
+    for positions in surah_positions.values():
+        pending: list[int] = []
+        for idx in positions:
+            ayah = int(ordered[idx].ayah)
+            while pending and int(ordered[pending[-1]].ayah) < ayah:
+                next_higher[pending.pop()] = idx
+            pending.append(idx)
+    return next_higher
+
+
 def _redistribute_dense_weak_runs(markers: list[Marker]) -> list[Marker]:
     if len(markers) < 4:
         return markers
 
-    ordered = sorted(markers, key=lambda item: (item.time, item.surah_number or 0, item.ayah))
+    ordered = sorted(markers, key=_marker_order_key)
+    starts = _marker_starts(ordered)
+    surah_positions = _surah_positions(ordered)
 
     def is_weak(marker: Marker) -> bool:
         quality = marker.quality or ""
@@ -1890,10 +2333,11 @@ def _redistribute_dense_weak_runs(markers: list[Marker]) -> list[Marker]:
             return True
         return quality == "ambiguous" and confidence <= 0.62
 
+    # Redistribution only retimes markers and raises inferred confidence, so weakness is fixed up front.
+    weak = [is_weak(marker) for marker in ordered]
     idx = 1
     while idx < len(ordered) - 1:
-        marker = ordered[idx]
-        if not is_weak(marker):
+        if not weak[idx]:
             idx += 1
             continue
 
@@ -1902,54 +2346,61 @@ def _redistribute_dense_weak_runs(markers: list[Marker]) -> list[Marker]:
         while run_end + 1 < len(ordered):
             current = ordered[run_end]
             nxt = ordered[run_end + 1]
-            current_time = int(current.start_time or current.time)
-            next_time = int(nxt.start_time or nxt.time)
             if (
                 nxt.surah == current.surah
                 and nxt.ayah == current.ayah + 1
-                and is_weak(nxt)
-                and (next_time - current_time) <= 25
+                and weak[run_end + 1]
+                and (starts[run_end + 1] - starts[run_end]) <= 25
             ):
                 run_end += 1
             else:
                 break
 
-        run = ordered[run_start : run_end + 1]
-        if len(run) < 4:
+        run_len = run_end - run_start + 1
+        if run_len < 4:
             idx = run_end + 1
             continue
 
-        run_span = int((run[-1].start_time or run[-1].time) - (run[0].start_time or run[0].time))
-        if run_span > max(8, len(run)):
+        first = ordered[run_start]
+        last = ordered[run_end]
+        run_span = int((last.start_time or last.time) - (first.start_time or first.time))
+        if run_span > max(8, run_len):
             idx = run_end + 1
             continue
 
         left = ordered[run_start - 1]
-        right: Marker | None = None
-        for right_idx in range(run_end + 1, len(ordered)):
-            candidate = ordered[right_idx]
-            if candidate.surah == run[0].surah and candidate.ayah > run[-1].ayah:
-                right = candidate
+        right_start: int | None = None
+        positions = surah_positions[first.surah]
+        for k in range(bisect_right(positions, run_end), len(positions)):
+            right_idx = positions[k]
+            if ordered[right_idx].ayah > last.ayah:
+                right_start = starts[right_idx]
                 break
-        if right is None:
+        if right_start is None:
             idx = run_end + 1
             continue
 
         left_bound = int(left.end_time or left.time) + 1
-        right_bound = int(right.start_time or right.time) - 1
+        right_bound = right_start - 1
         available = right_bound - left_bound
-        if available < len(run) * 3:
+        if available < run_len * 3:
             idx = run_end + 1
             continue
 
-        step = available / float(len(run) + 1)
-        for offset, weak_marker in enumerate(run, start=1):
-            target = int(round(left_bound + (step * offset)))
+        divisor = run_len + 1
+        for offset in range(1, run_len + 1):
+            weak_marker = ordered[run_start + offset - 1]
+            # left_bound + available * offset / divisor in integers, rounded half to even like round().
+            quotient, remainder = divmod(available * offset, divisor)
+            target = left_bound + quotient
+            if 2 * remainder > divisor or (2 * remainder == divisor and target & 1):
+                target += 1
             if target <= left_bound:
                 target = left_bound + offset
             weak_marker.time = target
             weak_marker.start_time = target
             weak_marker.end_time = target
+            starts[run_start + offset - 1] = target
             if weak_marker.quality == "inferred":
                 weak_marker.confidence = max(float(weak_marker.confidence or 0.56), 0.58)
 
@@ -1962,28 +2413,20 @@ def _extend_point_markers_to_next(markers: list[Marker], max_extension_seconds:
     if len(markers) < 2:
         return markers
 
-    ordered = sorted(markers, key=lambda item: (item.time, item.surah_number or 0, item.ayah))
+    ordered = sorted(markers, key=_marker_order_key)
+    starts = _marker_starts(ordered)
+    next_higher = _next_higher_ayah_positions(ordered, _surah_positions(ordered))
     for idx, marker in enumerate(ordered[:-1]):
-        start = int(marker.start_time or marker.time)
+        start = starts[idx]
         end = int(marker.end_time or marker.time)
         if end > start:
             continue
-        if marker.quality not in {"inferred", "ambiguous"}:
+        if marker.quality not in WEAK_QUALITIES:
             continue
 
-        next_marker: Marker | None = None
-        for look_ahead in range(idx + 1, len(ordered)):
-            candidate = ordered[look_ahead]
-            if candidate.surah != marker.surah:
-                continue
-            if int(candidate.ayah) <= int(marker.ayah):
-                continue
-            next_marker = candidate
-            break
-        if next_marker is None:
+        if next_higher[idx] < 0:
             continue
-
-        next_start = int(next_marker.start_time or next_marker.time)
+        next_start = starts[next_higher[idx]]
         if next_start <= start:
             continue
 
@@ -1999,27 +2442,29 @@ def _stabilize_weak_marker_durations(markers: list[Marker]) -> list[Marker]:
     if len(markers) < 2:
         return markers
 
-    ordered = sorted(markers, key=lambda item: (item.time, item.surah_number or 0, item.ayah))
+    ordered = sorted(markers, key=_marker_order_key)
+
+    surah_positions = _surah_positions(ordered)
 
     def nearest_step_seconds(index: int, fallback: float = 14.0) -> float:
         center = ordered[index]
+        center_ayah = center.ayah
+        center_start = center.start_time or center.time
+        positions = surah_positions[center.surah]
+        position = bisect_left(positions, index)
         # Use nearby same-surah anchors to estimate ayah pace.
         best: float | None = None
-        for left_idx in range(index - 1, -1, -1):
-            left = ordered[left_idx]
-            if left.surah != center.surah:
-                continue
-            ayah_gap = center.ayah - left.ayah
-            time_gap = (center.start_time or center.time) - (left.start_time or left.time)
+        for k in range(position - 1, -1, -1):
+            left = ordered[positions[k]]
+            ayah_gap = center_ayah - left.ayah
+            time_gap = center_start - (left.start_time or left.time)
             if ayah_gap > 0 and time_gap > 0:
                 best = time_gap / ayah_gap
                 break
-        for right_idx in range(index + 1, len(ordered)):
-            right = ordered[right_idx]
-            if right.surah != center.surah:
-                continue
-            ayah_gap = right.ayah - center.ayah
-            time_gap = (right.start_time or right.time) - (center.start_time or center.time)
+        for k in range(position + 1, len(positions)):
+            right = ordered[positions[k]]
+            ayah_gap = right.ayah - center_ayah
+            time_gap = (right.start_time or right.time) - center_start
             if ayah_gap > 0 and time_gap > 0:
                 right_step = time_gap / ayah_gap
                 if best is None:
@@ -2031,23 +2476,18 @@ def _stabilize_weak_marker_durations(markers: list[Marker]) -> list[Marker]:
             return fallback
         return max(6.0, min(26.0, best))
 
+    starts = _marker_starts(ordered)
+    next_higher = _next_higher_ayah_positions(ordered, surah_positions)
     for idx, marker in enumerate(ordered[:-1]):
-        if marker.quality not in {"inferred", "ambiguous"}:
+        if marker.quality not in WEAK_QUALITIES:
             continue
-        start = int(marker.start_time or marker.time)
-        next_marker: Marker | None = None
-        for look_ahead in range(idx + 1, len(ordered)):
-            candidate = ordered[look_ahead]
-            if candidate.surah != marker.surah:
-                continue
-            if int(candidate.ayah) <= int(marker.ayah):
-                continue
-            next_marker = candidate
-            break
-        if next_marker is None:
+        start = starts[idx]
+        next_idx = next_higher[idx]
+        if next_idx < 0:
             continue
+        next_marker = ordered[next_idx]
 
-        next_start = int(next_marker.start_time or next_marker.time)
+        next_start = starts[next_idx]
         available = next_start - start - 1
         if available <= 0:
             continue
@@ -2067,52 +2507,38 @@ def _stabilize_weak_marker_durations(markers: list[Marker]) -> list[Marker]:
         marker.end_time = max(start, target_end)
 
         # Prevent weak->weak markers from being too tightly packed when there is room to spread.
-        if next_marker.quality in {"inferred", "ambiguous"}:
+        if next_marker.quality in WEAK_QUALITIES:
             min_gap = 14 if marker.quality == "inferred" else 10
             current_gap = next_start - start
             if current_gap < min_gap:
-                ceiling = next_start
-                for look_ahead in range(idx + 2, len(ordered)):
-                    candidate = ordered[look_ahead]
-                    if candidate.surah != marker.surah:
-                        continue
-                    if int(candidate.ayah) <= int(next_marker.ayah):
-                        continue
-                    ceiling = int(candidate.start_time or candidate.time) - 1
-                    break
+                # Same-surah markers between the two have lower ayahs, so the next higher
+                # ayah after next_marker is the first one past idx + 1 as well.
+                ceiling = starts[next_higher[next_idx]] - 1 if next_higher[next_idx] >= 0 else next_start
                 target_next_start = min(ceiling, start + min_gap)
                 if target_next_start > next_start:
-                    next_marker.time = target_next_start
-                    next_marker.start_time = target_next_start
-                    next_marker.end_time = max(int(next_marker.end_time or target_next_start), target_next_start)
+                    next_marker.shift_start(target_next_start)
+                    starts[next_idx] = target_next_start
 
     return ordered
 
 
-def _prune_unrealistic_progression(markers: list[Marker]) -> list[Marker]:
-    if len(markers) < 3:
-        return markers
-
-    ordered = sorted(markers, key=lambda item: (item.time, item.surah_number or 0, item.ayah))
-    kept: list[Marker] = []
-    last_index_by_surah: dict[str, int] = {}
-
-    def rank(marker: Marker) -> int:
-        return _quality_rank(marker.quality)
-
-    for marker in ordered:
-        surah = marker.surah
-        last_idx = last_index_by_surah.get(surah)
-        if last_idx is None:
-            kept.append(marker)
-            last_index_by_surah[surah] = len(kept) - 1
+def _prune_progression_kernel(times, ayahs, surah_ids, ranks, last_slot, kept) -> int:
+    # Writes the indices of kept markers into `kept` and returns how many there are.
+    # last_slot holds, per surah id, the position in `kept` of that surah's latest kept marker.
+    # Plain index arithmetic only, so the same body runs on lists/array buffers or under numba.
+    kept_count = 0
+    for idx in range(len(times)):
+        surah_id = surah_ids[idx]
+        slot = last_slot[surah_id]
+        if slot < 0:
+            kept[kept_count] = idx
+            last_slot[surah_id] = kept_count
+            kept_count += 1
             continue
 
-        previous = kept[last_idx]
-        prev_time = int(previous.start_time or previous.time)
-        curr_time = int(marker.start_time or marker.time)
-        dt = curr_time - prev_time
-        da = int(marker.ayah) - int(previous.ayah)
+        previous = kept[slot]
+        dt = times[idx] - times[previous]
+        da = ayahs[idx] - ayahs[previous]
 
         if da <= 0:
             # Do not allow backward/same ayah repeats in the same-surah timeline here.
@@ -2121,20 +2547,58 @@ def _prune_unrealistic_progression(markers: list[Marker]) -> list[Marker]:
 
         # If two far-apart ayahs land on the same second, keep only the stronger one.
         if dt <= 1 and da > 1:
-            if rank(marker) > rank(previous):
-                kept[last_idx] = marker
+            if ranks[idx] > ranks[previous]:
+                kept[slot] = idx
             continue
 
         # Pace guard: prevent unrealistic surah leaps over very short time.
         # Allow roughly one ayah every ~3 seconds with a small buffer.
-        allowed_jump = max(3, int(max(0, dt) / 3) + 2)
-        if da > allowed_jump and rank(marker) < 4:
+        allowed_jump = max(3, max(0, dt) // 3 + 2)
+        if da > allowed_jump and ranks[idx] < 4:
             continue
 
-        kept.append(marker)
-        last_index_by_surah[surah] = len(kept) - 1
+        kept[kept_count] = idx
+        last_slot[surah_id] = kept_count
+        kept_count += 1
 
-    return kept
+    return kept_count
+
+
+if NUMBA_AVAILABLE:
+    _prune_progression_kernel_jit = njit(cache=True)(_prune_progression_kernel)
+
+
+def _prune_unrealistic_progression(markers: list[Marker]) -> list[Marker]:
+    if len(markers) < 3:
+        return markers
+
+    ordered = sorted(markers, key=_marker_order_key)
+    surah_ids: dict[str, int] = {}
+    for marker in ordered:
+        surah_ids.setdefault(marker.surah, len(surah_ids))
+
+    count = len(ordered)
+    if NUMBA_AVAILABLE:
+        kept = np.empty(count, dtype=np.int64)
+        kept_count = _prune_progression_kernel_jit(
+            np.fromiter(_marker_starts(ordered), dtype=np.int64, count=count),
+            np.fromiter((int(marker.ayah) for marker in ordered), dtype=np.int64, count=count),
+            np.fromiter((surah_ids[marker.surah] for marker in ordered), dtype=np.int64, count=count),
+            np.fromiter((_quality_rank(marker.quality) for marker in ordered), dtype=np.int64, count=count),
+            np.full(len(surah_ids), -1, dtype=np.int64),
+            kept,
+        )
+    else:
+        kept = array("q", bytes(8 * count))
+        kept_count = _prune_progression_kernel(
+            _marker_starts(ordered),
+            [int(marker.ayah) for marker in ordered],
+            [surah_ids[marker.surah] for marker in ordered],
+            [_quality_rank(marker.quality) for marker in ordered],
+            [-1] * len(surah_ids),
+            kept,
+        )
+    return [ordered[int(idx)] for idx in kept[:kept_count]]
 
 
 def _enforce_surah_transition_order(
@@ -2145,7 +2609,7 @@ def _enforce_surah_transition_order(
     if len(markers) < 3:
         return markers
 
-    ordered = sorted(markers, key=lambda item: (item.time, item.surah_number or 0, item.ayah))
+    ordered = sorted(markers, key=_marker_order_key)
     by_surah_number: dict[int, list[Marker]] = {}
     for marker in ordered:
         if marker.surah_number is None:
@@ -2171,49 +2635,50 @@ def _enforce_surah_transition_order(
         previous_final_time = int(previous_final.start_time or previous_final.time)
         boundary_floor = previous_final_time + max(1, int(min_gap_seconds))
 
-        upcoming_sorted = sorted(upcoming, key=lambda item: (item.time, item.ayah))
-        first_upcoming_time = int(upcoming_sorted[0].start_time or upcoming_sorted[0].time)
+        # Buckets are filled from the time-ordered timeline and only the previous surah has been
+        # shifted so far, so `upcoming` is already in (time, ayah) order.
+        first_upcoming_time = int(upcoming[0].start_time or upcoming[0].time)
         if first_upcoming_time >= boundary_floor:
             continue
 
         # Shift only early ayat near the transition so we preserve downstream timing.
-        for marker in upcoming_sorted:
+        for marker in upcoming:
             marker_time = int(marker.start_time or marker.time)
             if marker_time >= boundary_floor:
                 continue
             if int(marker.ayah) > 6:
                 continue
             adjusted = boundary_floor + max(0, int(marker.ayah) - 1)
-            marker.time = adjusted
-            marker.start_time = adjusted
-            marker.end_time = max(adjusted, int(marker.end_time or adjusted))
+            marker.shift_start(adjusted)
 
     return ordered
 
 
+def _entries_by_number(entry_lookup: dict[tuple[str, int], AyahEntry]) -> dict[tuple[int, int], AyahEntry]:
+    lookup: dict[tuple[int, int], AyahEntry] = {}
+    for entry in entry_lookup.values():
+        lookup[(int(entry.surah_number), int(entry.ayah))] = entry
+    return lookup
+
+
 def _enforce_long_ayah_inferred_floor(
     markers: list[Marker],
-    entry_lookup: dict[tuple[str, int], AyahEntry],
+    entry_by_number: dict[tuple[int, int], AyahEntry],
 ) -> list[Marker]:
     if len(markers) < 3:
         return markers
 
-    ordered = sorted(markers, key=lambda item: (item.time, item.surah_number or 0, item.ayah))
-    entry_by_number: dict[tuple[int, int], AyahEntry] = {}
-    for entry in entry_lookup.values():
-        entry_by_number[(int(entry.surah_number), int(entry.ayah))] = entry
-    by_surah: dict[str, list[Marker]] = {}
-    for marker in ordered:
-        by_surah.setdefault(marker.surah, []).append(marker)
+    ordered = sorted(markers, key=_marker_order_key)
+    by_surah_ayah = sorted(ordered, key=_surah_ayah_key)
 
-    for surah_markers in by_surah.values():
-        surah_markers.sort(key=lambda item: (int(item.ayah), int(item.time)))
+    for _, group in groupby(by_surah_ayah, key=attrgetter("surah")):
+        surah_markers = list(group)
         for prev, curr in zip(surah_markers, surah_markers[1:]):
             if int(curr.ayah) != int(prev.ayah) + 1:
                 continue
             if curr.quality != "inferred":
                 continue
-            if prev.quality not in {"high", "ambiguous", "manual"}:
+            if prev.quality not in ANCHOR_QUALITIES:
                 continue
 
             if prev.surah_number is None:
@@ -2222,7 +2687,7 @@ def _enforce_long_ayah_inferred_floor(
             if prev_entry is None:
                 continue
 
-            token_count = len([token for token in prev_entry.normalized.split() if token])
+            token_count = prev_entry.token_count
             if token_count < 45:
                 continue
 
@@ -2235,46 +2700,36 @@ def _enforce_long_ayah_inferred_floor(
                 continue
 
             shift_to = required_start
-            curr.time = shift_to
-            curr.start_time = shift_to
-            curr.end_time = max(shift_to, int(curr.end_time or shift_to))
+            curr.shift_start(shift_to)
 
-    return sorted(ordered, key=lambda item: (item.time, item.surah_number or 0, item.ayah))
+    return sorted(ordered, key=_marker_order_key)
 
 
 def _enforce_sequential_ayah_order(markers: list[Marker]) -> list[Marker]:
     if len(markers) < 3:
         return markers
 
-    ordered = sorted(markers, key=lambda item: (item.time, item.surah_number or 0, item.ayah))
-    by_surah: dict[str, list[Marker]] = {}
-    for marker in ordered:
-        by_surah.setdefault(marker.surah, []).append(marker)
-
-    for surah_markers in by_surah.values():
-        surah_markers.sort(key=lambda item: (int(item.ayah), int(item.time)))
-        prev_time: int | None = None
-        prev_ayah: int | None = None
-        for marker in surah_markers:
-            ayah = int(marker.ayah)
-            current = int(marker.start_time or marker.time)
-            if prev_time is None or prev_ayah is None:
-                prev_time = current
-                prev_ayah = ayah
-                continue
-            if ayah <= prev_ayah:
-                continue
-            min_gap = 1 if marker.quality in {"high", "manual"} else 2
-            required = prev_time + min_gap
+    ordered = sorted(markers, key=_marker_order_key)
+    by_surah_ayah = sorted(ordered, key=_surah_ayah_key)
+
+    for _, surah_markers in groupby(by_surah_ayah, key=attrgetter("surah")):
+        # Only the earliest marker of each ayah takes part; repeats of an ayah are left alone.
+        chain = [next(repeats) for _, repeats in groupby(surah_markers, key=lambda item: int(item.ayah))]
+        offsets = list(
+            accumulate(
+                (1 if marker.quality in STRONG_QUALITIES else 2 for marker in chain[1:]),
+                initial=0,
+            )
+        )
+        starts = _marker_starts(chain)
+        # start_i >= start_(i-1) + gap_i is a running max of start - cumulative gap, shifted back.
+        floors = accumulate((start - offset for start, offset in zip(starts, offsets)), max)
+        for marker, current, offset, floor in zip(chain, starts, offsets, floors):
+            required = floor + offset
             if current < required:
-                marker.time = required
-                marker.start_time = required
-                marker.end_time = max(required, int(marker.end_time or required))
-                current = required
-            prev_time = current
-            prev_ayah = ayah
+                marker.shift_start(required)
 
-    return sorted(ordered, key=lambda item: (item.time, item.surah_number or 0, item.ayah))
+    return sorted(ordered, key=_marker_order_key)
 
 
 def _quran_first_refine_weak_markers(
@@ -2286,20 +2741,18 @@ def _quran_first_refine_weak_markers(
     min_confidence: float,
     ambiguous_min_score: int,
     ambiguous_min_confidence: float,
+    score_cache: SegmentScoreCache | None = None,
+    time_index: SegmentTimeIndex | None = None,
 ) -> list[Marker]:
     if len(markers) < 3:
         return markers
 
-    ordered = sorted(markers, key=lambda item: (item.time, item.surah_number or 0, item.ayah))
-
-    def is_weak(marker: Marker) -> bool:
-        return marker.quality in {"inferred", "ambiguous"}
-
-    def is_anchor(marker: Marker) -> bool:
-        return marker.quality in {"high", "manual"}
-
+    ordered = sorted(markers, key=_marker_order_key)
+    starts = _marker_starts(ordered)
+    ranks = _marker_quality_ranks(ordered)
+    surah_positions = _surah_positions(ordered)
     for idx, marker in enumerate(ordered):
-        if not is_weak(marker):
+        if not 1 <= ranks[idx] <= 2:
             continue
 
         entry = entry_lookup.get((marker.surah, marker.ayah))
@@ -2310,41 +2763,45 @@ def _quran_first_refine_weak_markers(
         next_any: Marker | None = None
         prev_anchor: Marker | None = None
         next_anchor: Marker | None = None
+        next_any_start = 0
+        next_anchor_start = 0
 
-        for left in range(idx - 1, -1, -1):
+        positions = surah_positions[marker.surah]
+        position = bisect_left(positions, idx)
+        for k in range(position - 1, -1, -1):
+            left = positions[k]
             candidate = ordered[left]
-            if candidate.surah != marker.surah:
-                continue
             if int(candidate.ayah) >= int(marker.ayah):
                 continue
             prev_any = candidate
-            if is_anchor(candidate):
+            if ranks[left] >= 3:
                 prev_anchor = candidate
                 break
-        for right in range(idx + 1, len(ordered)):
+        for k in range(position + 1, len(positions)):
+            right = positions[k]
             candidate = ordered[right]
-            if candidate.surah != marker.surah:
-                continue
             if int(candidate.ayah) <= int(marker.ayah):
                 continue
             if next_any is None:
                 next_any = candidate
-            if is_anchor(candidate):
+                next_any_start = starts[right]
+            if ranks[right] >= 3:
                 next_anchor = candidate
+                next_anchor_start = starts[right]
                 break
 
+        current_start = starts[idx]
         left_bound = int(prev_any.end_time or prev_any.time) + 1 if prev_any is not None else 0
-        right_bound = int(next_any.start_time or next_any.time) - 1 if next_any is not None else int(marker.start_time or marker.time) + 180
+        right_bound = next_any_start - 1 if next_any is not None else current_start + 180
 
         if prev_anchor is not None:
             left_bound = max(left_bound, int(prev_anchor.end_time or prev_anchor.time) + 1)
         if next_anchor is not None:
-            right_bound = min(right_bound, int(next_anchor.start_time or next_anchor.time) - 1)
+            right_bound = min(right_bound, next_anchor_start - 1)
 
         if right_bound <= left_bound:
             continue
 
-        current_start = int(marker.start_time or marker.time)
         expected = max(left_bound, min(right_bound, current_start))
 
         best = _find_best_ayah_timestamp(
@@ -2358,6 +2815,8 @@ def _quran_first_refine_weak_markers(
             min_confidence=max(0.54, min_confidence - 0.10),
             ambiguous_min_score=max(64, ambiguous_min_score - 6),
             ambiguous_min_confidence=max(0.46, ambiguous_min_confidence - 0.06),
+            score_cache=score_cache,
+            time_index=time_index,
         )
         if best is None:
             continue
@@ -2369,8 +2828,8 @@ def _quran_first_refine_weak_markers(
         # Respect existing strong neighbors and avoid overlap with adjacent ayahs.
         if prev_any is not None and bounded_start <= int(prev_any.end_time or prev_any.time):
             continue
-        if next_any is not None and bounded_end >= int(next_any.start_time or next_any.time):
-            bounded_end = max(bounded_start, int(next_any.start_time or next_any.time) - 1)
+        if next_any is not None and bounded_end >= next_any_start:
+            bounded_end = max(bounded_start, next_any_start - 1)
             if bounded_end < bounded_start:
                 continue
 
@@ -2379,6 +2838,8 @@ def _quran_first_refine_weak_markers(
         marker.end_time = bounded_end
         marker.quality = matched_quality
         marker.confidence = round(max(float(marker.confidence or 0.0), matched_confidence), 3)
+        starts[idx] = bounded_start
+        ranks[idx] = _quality_rank(matched_quality)
 
     return ordered
 
@@ -2388,74 +2849,73 @@ def _delay_weak_markers_after_resets(
     fatiha_reset_times: list[float],
     transcript_segments: list[TranscriptSegment] | None = None,
     hold_seconds: int = 34,
+    time_index: SegmentTimeIndex | None = None,
 ) -> list[Marker]:
     if len(markers) < 2 or not fatiha_reset_times:
         return markers
 
-    ordered = sorted(markers, key=lambda item: (item.time, item.surah_number or 0, item.ayah))
+    ordered = sorted(markers, key=_marker_order_key)
     reset_points = sorted(int(round(item)) for item in fatiha_reset_times)
 
-    def is_weak(marker: Marker) -> bool:
-        return marker.quality in {"inferred", "ambiguous"}
+    # Positions of segments with enough text to count as speech, so lookups skip filler segments.
+    speech_positions = (
+        [
+            segment_index
+            for segment_index, segment in enumerate(transcript_segments)
+            if len(_normalized_segment_text(segment)) >= 6
+        ]
+        if transcript_segments is not None
+        else []
+    )
 
     def has_local_speech(second: int, window: int = 18) -> bool:
         if transcript_segments is None:
             return True
         lo = float(max(0, second - window))
         hi = float(second + window)
-        for segment in transcript_segments:
+        overlapping = _segments_overlapping(transcript_segments, lo, hi, time_index)
+        for position in range(bisect_left(speech_positions, overlapping.start), len(speech_positions)):
+            segment_index = speech_positions[position]
+            if segment_index >= overlapping.stop:
+                break
+            segment = transcript_segments[segment_index]
             seg_start = float(segment.start)
             seg_end = float(segment.end)
             if seg_end < lo or seg_start > hi:
                 continue
-            normalized = normalize_arabic(segment.text, strict=False)
-            if len(normalized) >= 6:
-                return True
+            return True
         return False
 
-    for idx, marker in enumerate(ordered):
-        if not is_weak(marker):
-            continue
-
-        marker_start = int(marker.start_time or marker.time)
-        recent_reset: int | None = None
-        next_reset: int | None = None
-        for reset in reset_points:
-            if reset <= marker_start:
-                recent_reset = reset
-            else:
-                next_reset = reset
-                break
-        # If weak marker sits in a low-speech zone right before an upcoming reset,
-        # prefer deferring to post-reset even when there was an earlier reset.
-        if next_reset is not None and (next_reset - marker_start) <= 120 and not has_local_speech(marker_start):
-            min_start = next_reset + hold_seconds
-        elif recent_reset is None:
-            continue
-        else:
-            min_start = recent_reset + hold_seconds
-            if marker_start >= min_start:
-                continue
-
-        next_same_surah_start: int | None = None
-        for look_ahead in range(idx + 1, len(ordered)):
-            candidate = ordered[look_ahead]
-            if candidate.surah != marker.surah:
-                continue
-            if int(candidate.ayah) <= int(marker.ayah):
-                continue
-            next_same_surah_start = int(candidate.start_time or candidate.time)
-            break
-
-        target = min_start
-        if next_same_surah_start is not None:
-            target = min(target, next_same_surah_start - 1)
-        if target <= marker_start:
-            continue
-
-        marker.time = target
-        marker.start_time = target
-        marker.end_time = max(int(marker.end_time or target), target)
+    # Every read below is of an unmoved start (next_higher only points forward), so the
+    # targets can be computed for all markers at once and applied afterwards.
+    starts = np.fromiter(_marker_starts(ordered), dtype=np.int64, count=len(ordered))
+    next_higher = np.fromiter(
+        _next_higher_ayah_positions(ordered, _surah_positions(ordered)), dtype=np.int64, count=len(ordered)
+    )
+    weak = np.fromiter((marker.quality in WEAK_QUALITIES for marker in ordered), dtype=bool, count=len(ordered))
+    resets = np.asarray(reset_points, dtype=np.int64)
+
+    reset_position = np.searchsorted(resets, starts, side="right")
+    has_recent = reset_position > 0
+    has_next = reset_position < resets.size
+    recent_reset = resets[np.maximum(reset_position - 1, 0)]
+    next_reset = resets[np.minimum(reset_position, resets.size - 1)]
+
+    # If weak marker sits in a low-speech zone right before an upcoming reset,
+    # prefer deferring to post-reset even when there was an earlier reset.
+    defer = weak & has_next & ((next_reset - starts) <= 120)
+    for idx in np.flatnonzero(defer):
+        if has_local_speech(int(starts[idx])):
+            defer[idx] = False
+
+    min_start = np.where(defer, next_reset, recent_reset) + hold_seconds
+    eligible = weak & (defer | (has_recent & (starts < min_start)))
+    has_next_higher = next_higher >= 0
+    next_same_surah_start = starts[np.where(has_next_higher, next_higher, 0)]
+    targets = np.where(has_next_higher, np.minimum(min_start, next_same_surah_start - 1), min_start)
+
+    for idx in np.flatnonzero(eligible & (targets > starts)):
+        ordered[idx].shift_start(int(targets[idx]))
 
     return ordered
 
@@ -2475,6 +2935,8 @@ def _build_transition_tail_markers(
     ambiguous_min_score: int,
     ambiguous_min_confidence: float,
     require_weak_support_for_inferred: bool,
+    score_cache: SegmentScoreCache | None = None,
+    time_index: SegmentTimeIndex | None = None,
 ) -> list[Marker]:
     if previous.surah == next_entry.surah:
         return []
@@ -2509,7 +2971,7 @@ def _build_transition_tail_markers(
     def _next_ayah_delay_seconds(entry: AyahEntry | None) -> int:
         if entry is None:
             return 8
-        token_count = len([token for token in entry.normalized.split() if token])
+        token_count = entry.token_count
         # Long ayat should reserve more time before searching for the next ayah start.
         # 2:282 and similar passages otherwise cause premature ayah shifts.
         return max(6, min(70, int(round(token_count * 0.45))))
@@ -2536,6 +2998,8 @@ def _build_transition_tail_markers(
             min_confidence=relaxed_min_conf,
             ambiguous_min_score=relaxed_ambig_score,
             ambiguous_min_confidence=relaxed_ambig_conf,
+            score_cache=score_cache,
+            time_index=time_index,
         )
 
         if best is None:
@@ -2555,6 +3019,8 @@ def _build_transition_tail_markers(
                     min_confidence=max(0.52, relaxed_min_conf - 0.02),
                     ambiguous_min_score=max(60, relaxed_ambig_score - 2),
                     ambiguous_min_confidence=max(0.44, relaxed_ambig_conf - 0.02),
+                    score_cache=score_cache,
+                    time_index=time_index,
                 )
 
         if best is not None:
@@ -2596,6 +3062,8 @@ def _build_transition_tail_markers(
                         min_confidence=min_confidence,
                         ambiguous_min_score=ambiguous_min_score,
                         ambiguous_min_confidence=ambiguous_min_confidence,
+                        score_cache=score_cache,
+                        time_index=time_index,
                     )
 
             if wide_best is not None:
@@ -2628,6 +3096,7 @@ def _build_transition_tail_markers(
                     end_time=local_end,
                     max_silence_seconds=16,
                     min_density=0.14,
+                    time_index=time_index,
                 ):
                     continue
                 if not _has_weak_local_support(
@@ -2637,6 +3106,8 @@ def _build_transition_tail_markers(
                     window_end=local_end,
                     min_score=max(58, relaxed_ambig_score - 6),
                     min_overlap=max(0.04, relaxed_min_overlap - 0.03),
+                    score_cache=score_cache,
+                    time_index=time_index,
                 ):
                     continue
 
@@ -2703,8 +3174,8 @@ def _is_valid_forward_transition(
 
 
 def _should_replace_existing(existing: Marker, candidate: Marker) -> bool:
-    existing_rank = _quality_rank(existing.quality)
-    candidate_rank = _quality_rank(candidate.quality)
+    existing_rank = QUALITY_RANKS.get(existing.quality, 0)
+    candidate_rank = QUALITY_RANKS.get(candidate.quality, 0)
     if candidate_rank > existing_rank:
         return True
     if candidate_rank < existing_rank:
@@ -2742,10 +3213,22 @@ def _candidate_is_valid(
         and confidence >= ambiguous_min_confidence
     )
     if not is_high and not is_ambiguous:
-        return False, None, round(confidence, 3)
+        # Callers discard the confidence of rejected candidates, so skip rounding it.
+        return False, None, 0.0
     return True, ("high" if is_high else "ambiguous"), round(confidence, 3)
 
 
+@lru_cache(maxsize=500_000)
+def _anchor_token_matches(anchor: str, token: str, required_similarity: float) -> bool:
+    # Corpus anchors and transcript tokens recur across every (window, ayah) pair, so the
+    # verdict is memoized rather than rescored per call. With score_cutoff rapidfuzz returns 0
+    # below the threshold and can bail early; partial_ratio only runs when ratio falls short.
+    return bool(
+        fuzz.ratio(anchor, token, score_cutoff=required_similarity)
+        or fuzz.partial_ratio(anchor, token, score_cutoff=required_similarity)
+    )
+
+
 def _has_anchor_token_hit(
     entry: AyahEntry,
     normalized_text: str,
@@ -2755,30 +3238,30 @@ def _has_anchor_token_hit(
     if not normalized_text:
         return False
 
-    anchors: list[str] = []
-    for form in entry.match_forms:
-        anchors.extend(_anchor_tokens_for_form(form))
-
+    anchors = entry.anchor_tokens
     if not anchors:
         return False
 
     # If a phrase only has short anchor tokens (e.g. muqatta'at like "الف لام ميم"),
     # relax min length while requiring slightly higher similarity.
     effective_min_anchor_len = min_anchor_len
-    if not any(len(anchor) >= min_anchor_len for anchor in anchors):
+    if entry.anchor_max_len < min_anchor_len:
         effective_min_anchor_len = 3
 
     tokens = [token for token in normalized_text.split() if len(token) >= 2]
     if not tokens:
         return False
 
+    # An anchor that appears verbatim scores 100 and clears any threshold.
+    if any(len(token) >= effective_min_anchor_len for token in entry.anchor_set.intersection(tokens)):
+        return True
+
     for anchor in anchors:
         if len(anchor) < effective_min_anchor_len:
             continue
         for token in tokens:
             required_similarity = min_similarity + 4.0 if len(anchor) <= 3 or len(token) <= 3 else min_similarity
-            similarity = max(float(fuzz.ratio(anchor, token)), float(fuzz.partial_ratio(anchor, token)))
-            if similarity >= required_similarity:
+            if _anchor_token_matches(anchor, token, required_similarity):
                 return True
     return False
 
@@ -2820,6 +3303,8 @@ def match_quran_markers(
 ) -> list[Marker]:
     if not transcript_segments or not corpus_entries:
         return []
+    score_cache: SegmentScoreCache = {}
+    time_index = _segment_time_index(transcript_segments)
 
     surah_totals: dict[str, int] = {}
     for item in corpus_entries:
@@ -2830,6 +3315,9 @@ def match_quran_markers(
     entry_lookup: dict[tuple[str, int], AyahEntry] = {(entry.surah, entry.ayah): entry for entry in corpus_entries}
     markers: list[Marker] = []
     marker_positions: dict[tuple[str, int], int] = {}
+    # Positions in `markers` per surah; entries are only ever appended or replaced in place by
+    # a marker with the same (surah, ayah) key.
+    surah_marker_positions: dict[str, list[int]] = {}
     if forced_start_index is not None and 0 <= forced_start_index < len(corpus_entries):
         last_matched_index = forced_start_index - 1
     else:
@@ -2853,6 +3341,7 @@ def match_quran_markers(
             continue
         reanchor_schedule.append((at_time, mapped_index))
     reanchor_schedule.sort(key=lambda item: item[0])
+    reanchor_times = [at_time for at_time, _ in reanchor_schedule]
     reanchor_cursor = 0
     normalized_constraints: list[tuple[float, float, int | None, int | None]] = []
     for item in segment_constraints or []:
@@ -2900,13 +3389,14 @@ def match_quran_markers(
         segment_start = float(segment.start)
         segment_end = float(segment.end)
         active_constraint = _constraint_for_time(segment_start)
-        while reanchor_cursor < len(reanchor_schedule) and segment_start >= reanchor_schedule[reanchor_cursor][0]:
-            mapped_index = reanchor_schedule[reanchor_cursor][1]
-            last_matched_index = mapped_index - 1
+        reanchor_reached = bisect_right(reanchor_times, segment_start)
+        if reanchor_reached > reanchor_cursor:
+            # Each reanchor overwrites the last, so only the latest one passed applies.
+            last_matched_index = reanchor_schedule[reanchor_reached - 1][1] - 1
             awaiting_reacquire = True
             pause_reacquire_until = None
             reacquire_lock_ayahs_remaining = max(reacquire_lock_ayahs_remaining, 8)
-            reanchor_cursor += 1
+            reanchor_cursor = reanchor_reached
         if (
             previous_segment_end is not None
             and (segment_start - previous_segment_end) >= float(max(30, long_break_reacquire_seconds))
@@ -2917,28 +3407,28 @@ def match_quran_markers(
             reacquire_lock_ayahs_remaining = max(reacquire_lock_ayahs_remaining, 8)
         previous_segment_end = segment_end
 
-        normalized_segment = normalize_arabic(segment.text, strict=False)
+        normalized_segment = _normalized_segment_text(segment)
         if _is_fatiha_like_segment(normalized_segment):
-            fatiha_reset_times.append(float(segment.start))
+            fatiha_reset_times.append(segment_start)
             awaiting_reacquire = True
             reacquire_lock_ayahs_remaining = max(reacquire_lock_ayahs_remaining, 8)
             continue
         if _is_non_recitation_segment(normalized_segment):
-            fatiha_reset_times.append(float(segment.start))
-            pause_reacquire_until = float(segment.end) + float(max(8, non_recitation_hold_seconds))
+            fatiha_reset_times.append(segment_start)
+            pause_reacquire_until = segment_end + float(max(8, non_recitation_hold_seconds))
             awaiting_reacquire = True
             reacquire_lock_ayahs_remaining = max(reacquire_lock_ayahs_remaining, 8)
             continue
-        if pause_reacquire_until is not None and float(segment.start) <= pause_reacquire_until:
+        if pause_reacquire_until is not None and segment_start <= pause_reacquire_until:
             continue
         segment_variants: list[tuple[str, float, int, int, float, float]] = [
-            (normalized_segment, 0.0, segment_index, segment_index, float(segment.start), float(segment.end))
+            (normalized_segment, 0.0, segment_index, segment_index, segment_start, segment_end)
         ]
         if segment_index > 0:
             prev_segment = transcript_segments[segment_index - 1]
             prev_end = float(prev_segment.end)
-            if float(segment.start) - prev_end <= 2.5:
-                prev_normalized = normalize_arabic(prev_segment.text, strict=False)
+            if segment_start - prev_end <= 2.5:
+                prev_normalized = _normalized_segment_text(prev_segment)
                 if len(prev_normalized) >= 2:
                     back_combined = f"{prev_normalized} {normalized_segment}".strip()
                     segment_variants.append(
@@ -2948,11 +3438,11 @@ def match_quran_markers(
                             segment_index - 1,
                             segment_index,
                             float(prev_segment.start),
-                            float(segment.end),
+                            segment_end,
                         )
                     )
         combined_text = normalized_segment
-        previous_end = float(segment.end)
+        previous_end = segment_end
         for offset in range(1, 7):
             next_idx = segment_index + offset
             if next_idx >= len(transcript_segments):
@@ -2960,17 +3450,18 @@ def match_quran_markers(
             next_segment = transcript_segments[next_idx]
             if float(next_segment.start) - previous_end > 2.5:
                 break
-            next_normalized = normalize_arabic(next_segment.text, strict=False)
+            next_normalized = _normalized_segment_text(next_segment)
             if len(next_normalized) < 2:
                 break
-            combined_text = f"{combined_text} {next_normalized}".strip()
+            # Both sides are already normalized (stripped); only an empty seed needs no separator.
+            combined_text = f"{combined_text} {next_normalized}" if combined_text else next_normalized
             segment_variants.append(
                 (
                     combined_text,
                     float(offset) * 1.1,
                     segment_index,
                     next_idx,
-                    float(segment.start),
+                    segment_start,
                     float(next_segment.end),
                 )
             )
@@ -2980,8 +3471,10 @@ def match_quran_markers(
         if all(len(text) < 8 and len(text.split()) < 2 for text, _, _, _, _, _ in segment_variants):
             continue
 
-        segment_words = list(getattr(segment, "words", None) or [])
-        word_windows = list(generate_word_windows(segment_words, min_window=4, max_window=8))
+        word_windows = _segment_word_windows(segment, min_window=4, max_window=8)
+
+        # Without an anchor hit a candidate must reach this adjusted score to count.
+        unanchored_floor = float(max(64, min_score - 6))
 
         def evaluate_index(index: int) -> CandidateEvidence | None:
             if index < 0 or index >= len(corpus_entries):
@@ -2993,9 +3486,9 @@ def match_quran_markers(
                 if max_index is not None and index > max_index:
                     return None
             entry = corpus_entries[index]
-            if is_excluded_surah(entry.surah):
+            if entry.is_excluded:
                 return None
-            is_muqattaat = _is_muqattaat_entry(entry)
+            is_muqattaat = entry.is_muqattaat
 
             best: CandidateEvidence | None = None
             for (
@@ -3008,10 +3501,12 @@ def match_quran_markers(
             ) in segment_variants:
                 if is_muqattaat and not _has_muqattaat_phrase_match(variant_text, entry):
                     continue
-                score, overlap = _score_segment_against_entry(variant_text, entry)
                 has_anchor = _has_anchor_token_hit(entry, variant_text)
+                score, overlap = _score_segment_against_entry(
+                    variant_text, entry, -1.0 if has_anchor else unanchored_floor + penalty - 1e-6
+                )
                 adjusted = score - penalty
-                if not has_anchor and adjusted < float(max(64, min_score - 6)):
+                if not has_anchor and adjusted < unanchored_floor:
                     continue
                 if has_anchor:
                     adjusted += 2.0
@@ -3025,7 +3520,7 @@ def match_quran_markers(
                         normalized_text=variant_text,
                         start_time=variant_start_time,
                         end_time=variant_end_time,
-                        word_indices=[],
+                        word_indices=(),
                         segment_start_index=variant_start_index,
                         segment_end_index=variant_end_index,
                     )
@@ -3034,10 +3529,12 @@ def match_quran_markers(
                 if is_muqattaat and not _has_muqattaat_phrase_match(window.normalized_text, entry):
                     continue
                 penalty = _window_penalty(len(window.word_indices))
-                score, overlap = _score_segment_against_entry(window.normalized_text, entry)
                 has_anchor = _has_anchor_token_hit(entry, window.normalized_text)
+                score, overlap = _score_segment_against_entry(
+                    window.normalized_text, entry, -1.0 if has_anchor else unanchored_floor + penalty - 1e-6
+                )
                 adjusted = score - penalty
-                if not has_anchor and adjusted < float(max(64, min_score - 6)):
+                if not has_anchor and adjusted < unanchored_floor:
                     continue
                 if has_anchor:
                     adjusted += 2.0
@@ -3051,7 +3548,7 @@ def match_quran_markers(
                         normalized_text=window.normalized_text,
                         start_time=window.start_time,
                         end_time=window.end_time,
-                        word_indices=list(window.word_indices),
+                        word_indices=window.word_indices,
                         segment_start_index=segment_index,
                         segment_end_index=segment_index,
                     )
@@ -3097,8 +3594,9 @@ def match_quran_markers(
                 repeat_best_candidate: CandidateEvidence | None = None
                 repeat_best_confidence = 0.0
 
+                rewind_top_two = _top_two_scores(rewind_candidates)
                 for index, candidate in rewind_candidates.items():
-                    rival = _best_rival_score(rewind_candidates, index=index)
+                    rival = max(0.0, _rival_from_top_two(rewind_top_two, index, default=-1.0))
                     valid, quality, confidence = _candidate_is_valid(
                         candidate=candidate,
                         rival_score=rival,
@@ -3159,9 +3657,8 @@ def match_quran_markers(
                             )
 
                             next_same_surah_start: int | None = None
-                            for candidate_marker in markers:
-                                if candidate_marker.surah != existing_marker.surah:
-                                    continue
+                            for position in surah_marker_positions.get(existing_marker.surah, ()):
+                                candidate_marker = markers[position]
                                 if int(candidate_marker.ayah) <= int(existing_marker.ayah):
                                     continue
                                 candidate_start = int(candidate_marker.start_time or candidate_marker.time)
@@ -3230,20 +3727,14 @@ def match_quran_markers(
                 candidate = evaluate_index(index)
                 if candidate is not None:
                     normal_candidates[index] = candidate
+            normal_top_two = _top_two_scores(normal_candidates)
 
             for index in normal_candidate_indices:
                 candidate = normal_candidates.get(index)
                 if candidate is None:
                     continue
                 is_immediate_expected = index == expected
-                rival = max(
-                    (
-                        other.adjusted_score
-                        for other_index, other in normal_candidates.items()
-                        if other_index != index
-                    ),
-                    default=-1.0,
-                )
+                rival = _rival_from_top_two(normal_top_two, index, default=-1.0)
                 valid, quality, confidence = _candidate_is_valid(
                     candidate=candidate,
                     rival_score=rival,
@@ -3369,7 +3860,12 @@ def match_quran_markers(
 
             if selected_index is None:
                 recovery_start = max(expected, 0)
-                recovery_end = min(len(corpus_entries), recovery_start + 60)
+                # Indices past the recovery jump limit are rejected after scoring, so never score them.
+                recovery_end = min(
+                    len(corpus_entries),
+                    recovery_start + 60,
+                    last_matched_index + max_recovery_jump_ayahs + 1,
+                )
                 recovery_best_index = -1
                 recovery_best: CandidateEvidence | None = None
                 recovery_best_conf = 0.0
@@ -3472,6 +3968,8 @@ def match_quran_markers(
                 ambiguous_min_score=ambiguous_min_score,
                 ambiguous_min_confidence=ambiguous_min_confidence,
                 require_weak_support_for_inferred=require_weak_support_for_inferred,
+                score_cache=score_cache,
+                time_index=time_index,
             )
             if tail_markers:
                 for tail_marker in tail_markers:
@@ -3484,6 +3982,7 @@ def match_quran_markers(
                     else:
                         markers.append(tail_marker)
                         marker_positions[tail_key] = len(markers) - 1
+                        surah_marker_positions.setdefault(tail_marker.surah, []).append(len(markers) - 1)
                 previous_for_transition = max(tail_markers, key=lambda item: (item.ayah, item.time))
 
             previous_total = surah_totals.get(previous_marker.surah, previous_marker.ayah)
@@ -3542,9 +4041,11 @@ def match_quran_markers(
             else:
                 markers.append(marker_candidate)
                 marker_positions[key] = len(markers) - 1
+                surah_marker_positions.setdefault(marker_candidate.surah, []).append(len(markers) - 1)
         else:
             markers.append(marker_candidate)
             marker_positions[key] = len(markers) - 1
+            surah_marker_positions.setdefault(marker_candidate.surah, []).append(len(markers) - 1)
 
         last_matched_index = max(last_matched_index, selected_index)
         last_marker_time = max(last_marker_time, accepted_marker.time)
@@ -3560,18 +4061,23 @@ def match_quran_markers(
     anchors = [item for item in sorted(markers, key=lambda m: m.time) if _is_anchor_quality(item.quality)]
 
     for left, right in zip(anchors, anchors[1:]):
-        if left.surah != right.surah:
+        # Anchors are only read in this loop; bind the fields once per pair.
+        left_time, left_ayah, left_surah = left.time, left.ayah, left.surah
+        left_surah_number, left_confidence = left.surah_number, left.confidence
+        right_time, right_ayah, right_surah = right.time, right.ayah, right.surah
+        right_surah_number, right_confidence = right.surah_number, right.confidence
+        if left_surah != right_surah:
             transition_tail = _build_transition_tail_markers(
                 previous=left,
                 next_entry=AyahEntry(
-                    surah_number=right.surah_number or 0,
-                    surah=right.surah,
-                    ayah=right.ayah,
+                    surah_number=right_surah_number or 0,
+                    surah=right_surah,
+                    ayah=right_ayah,
                     text="",
                     normalized="",
                     match_forms=[],
                 ),
-                transition_time=right.time,
+                transition_time=right_time,
                 surah_totals=surah_totals,
                 entry_lookup=entry_lookup,
                 transcript_segments=transcript_segments,
@@ -3583,6 +4089,8 @@ def match_quran_markers(
                 ambiguous_min_score=ambiguous_min_score,
                 ambiguous_min_confidence=ambiguous_min_confidence,
                 require_weak_support_for_inferred=require_weak_support_for_inferred,
+                score_cache=score_cache,
+                time_index=time_index,
             )
             for marker_to_add in transition_tail:
                 key = (marker_to_add.surah, marker_to_add.ayah)
@@ -3591,18 +4099,18 @@ def match_quran_markers(
                 inferred_markers.append(marker_to_add)
                 keyed_markers[key] = marker_to_add
             continue
-        if left.ayah >= right.ayah:
+        if left_ayah >= right_ayah:
             continue
 
-        missing_count = right.ayah - left.ayah - 1
+        missing_count = right_ayah - left_ayah - 1
         if missing_count <= 0:
             continue
         strong_bridge = _is_strong_anchor_marker(left) and _is_strong_anchor_marker(right)
 
-        gap_seconds = right.time - left.time
+        gap_seconds = right_time - left_time
         if gap_seconds <= min_gap_seconds or gap_seconds > max_infer_gap_seconds:
             continue
-        resets_between = _reset_points_between(fatiha_reset_times, left.time, right.time)
+        resets_between = _reset_points_between(fatiha_reset_times, left_time, right_time)
         if resets_between:
             search_floor = resets_between[0] + max(6, min_gap_seconds)
             searched = _recover_missing_gap_with_search(
@@ -3619,6 +4127,8 @@ def match_quran_markers(
                 require_weak_support_for_inferred=require_weak_support_for_inferred,
                 search_floor_time=search_floor,
                 exhaustive_ahead_search=True,
+                score_cache=score_cache,
+                time_index=time_index,
             )
             for marker_to_add in searched:
                 key = (marker_to_add.surah, marker_to_add.ayah)
@@ -3627,24 +4137,24 @@ def match_quran_markers(
                 inferred_markers.append(marker_to_add)
                 keyed_markers[key] = marker_to_add
             if not searched:
-                fallback_window_start = left.time + min_gap_seconds
-                fallback_window_end = right.time - min_gap_seconds
+                fallback_window_start = left_time + min_gap_seconds
+                fallback_window_end = right_time - min_gap_seconds
                 fallback_start = max(fallback_window_start, search_floor)
-                fallback_span = right.time - fallback_start
+                fallback_span = right_time - fallback_start
                 if fallback_span > min_gap_seconds and missing_count > 0:
                     fallback_step = fallback_span / float(missing_count + 1)
                     if fallback_step >= float(min_infer_step_seconds):
-                        fallback_prev_time = int(left.time)
-                        fallback_prev_ayah = int(left.ayah)
-                        for offset_idx, ayah_number in enumerate(range(left.ayah + 1, right.ayah), start=1):
-                            key = (left.surah, ayah_number)
+                        fallback_prev_time = int(left_time)
+                        fallback_prev_ayah = int(left_ayah)
+                        for offset_idx, ayah_number in enumerate(range(left_ayah + 1, right_ayah), start=1):
+                            key = (left_surah, ayah_number)
                             if key in keyed_markers:
                                 fallback_prev_ayah = ayah_number
                                 existing = keyed_markers[key]
                                 fallback_prev_time = int(existing.start_time or existing.time)
                                 continue
                             entry = entry_lookup.get(key)
-                            previous_entry = entry_lookup.get((left.surah, fallback_prev_ayah))
+                            previous_entry = entry_lookup.get((left_surah, fallback_prev_ayah))
                             previous_duration = _estimated_ayah_duration_seconds(previous_entry)
                             long_ayah_hold = int(round(previous_duration * 0.72)) if previous_duration >= 28 else max(6, int(round(fallback_step * 0.7)))
                             start_floor_from_previous = fallback_prev_time + long_ayah_hold
@@ -3664,6 +4174,8 @@ def match_quran_markers(
                                         min_confidence=max(0.54, min_confidence - 0.10),
                                         ambiguous_min_score=max(62, ambiguous_min_score - 10),
                                         ambiguous_min_confidence=max(0.45, ambiguous_min_confidence - 0.08),
+                                        score_cache=score_cache,
+                                        time_index=time_index,
                                     )
                                     if best_forward is not None:
                                         matched_time, matched_end, quality, confidence = best_forward
@@ -3674,10 +4186,10 @@ def match_quran_markers(
                                                 max(fallback_window_start, min(fallback_window_end, int(matched_time))),
                                                 min(fallback_window_end, int(matched_end)),
                                             ),
-                                            surah=left.surah,
-                                            surah_number=left.surah_number,
+                                            surah=left_surah,
+                                            surah_number=left_surah_number,
                                             ayah=ayah_number,
-                                            juz=get_juz_for_ayah(left.surah_number or 1, ayah_number),
+                                            juz=get_juz_for_ayah(left_surah_number or 1, ayah_number),
                                             quality=quality,
                                             confidence=round(confidence, 3),
                                         )
@@ -3710,6 +4222,8 @@ def match_quran_markers(
                                         min_confidence=min_confidence,
                                         ambiguous_min_score=ambiguous_min_score,
                                         ambiguous_min_confidence=ambiguous_min_confidence,
+                                        score_cache=score_cache,
+                                        time_index=time_index,
                                     )
                                     if wide_best is not None:
                                         matched_time, matched_end, quality, confidence = wide_best
@@ -3720,10 +4234,10 @@ def match_quran_markers(
                                                 max(fallback_window_start, min(fallback_window_end, int(matched_time))),
                                                 min(fallback_window_end, int(matched_end)),
                                             ),
-                                            surah=left.surah,
-                                            surah_number=left.surah_number,
+                                            surah=left_surah,
+                                            surah_number=left_surah_number,
                                             ayah=ayah_number,
-                                            juz=get_juz_for_ayah(left.surah_number or 1, ayah_number),
+                                            juz=get_juz_for_ayah(left_surah_number or 1, ayah_number),
                                             quality=quality,
                                             confidence=round(confidence, 3),
                                         )
@@ -3741,6 +4255,7 @@ def match_quran_markers(
                                     end_time=support_end,
                                     max_silence_seconds=16,
                                     min_density=0.14,
+                                    time_index=time_index,
                                 ):
                                     continue
                                 if not _has_weak_local_support(
@@ -3750,25 +4265,27 @@ def match_quran_markers(
                                     window_end=support_end,
                                     min_score=max(60, ambiguous_min_score - 8),
                                     min_overlap=max(0.07, min_overlap - 0.05),
+                                    score_cache=score_cache,
+                                    time_index=time_index,
                                 ):
                                     continue
                             marker_to_add = Marker(
                                 time=inferred_time,
                                 start_time=inferred_time,
                                 end_time=inferred_time,
-                                surah=left.surah,
-                                surah_number=left.surah_number,
+                                surah=left_surah,
+                                surah_number=left_surah_number,
                                 ayah=ayah_number,
-                                juz=get_juz_for_ayah(left.surah_number or 1, ayah_number),
+                                juz=get_juz_for_ayah(left_surah_number or 1, ayah_number),
                                 quality="inferred",
-                                confidence=round(min(left.confidence or 0.56, right.confidence or 0.56, 0.56), 3),
+                                confidence=round(min(left_confidence or 0.56, right_confidence or 0.56, 0.56), 3),
                             )
                             inferred_markers.append(marker_to_add)
                             keyed_markers[key] = marker_to_add
                             fallback_prev_ayah = ayah_number
                             fallback_prev_time = int(marker_to_add.start_time or marker_to_add.time)
             continue
-        if _has_low_data_gap(transcript_segments, left.time, right.time):
+        if _has_low_data_gap(transcript_segments, left_time, right_time, time_index=time_index):
             continue
 
         step_seconds = gap_seconds / (missing_count + 1)
@@ -3789,6 +4306,8 @@ def match_quran_markers(
                 ambiguous_min_score=ambiguous_min_score,
                 ambiguous_min_confidence=ambiguous_min_confidence,
                 require_weak_support_for_inferred=require_weak_support_for_inferred,
+                score_cache=score_cache,
+                time_index=time_index,
             )
             for marker_to_add in searched:
                 key = (marker_to_add.surah, marker_to_add.ayah)
@@ -3797,31 +4316,31 @@ def match_quran_markers(
                 inferred_markers.append(marker_to_add)
                 keyed_markers[key] = marker_to_add
             continue
-        rolling_prev_time = int(left.time)
-        rolling_prev_ayah = int(left.ayah)
+        rolling_prev_time = int(left_time)
+        rolling_prev_ayah = int(left_ayah)
 
         for offset in range(1, missing_count + 1):
-            ayah_number = left.ayah + offset
-            key = (left.surah, ayah_number)
+            ayah_number = left_ayah + offset
+            key = (left_surah, ayah_number)
             if key in keyed_markers:
                 rolling_prev_ayah = ayah_number
                 existing = keyed_markers[key]
                 rolling_prev_time = int(existing.start_time or existing.time)
                 continue
 
-            expected_time = int(round(left.time + (step_seconds * offset)))
+            expected_time = int(round(left_time + (step_seconds * offset)))
             window_half = max(10, int(round(step_seconds * 0.8)))
-            window_start = max(left.time + min_gap_seconds, expected_time - window_half)
-            window_end = min(right.time - min_gap_seconds, expected_time + window_half)
+            window_start = max(left_time + min_gap_seconds, expected_time - window_half)
+            window_end = min(right_time - min_gap_seconds, expected_time + window_half)
 
             entry = entry_lookup.get(key)
-            inferred_time = int(round(left.time + (step_seconds * offset)))
+            inferred_time = int(round(left_time + (step_seconds * offset)))
             inferred_time = _defer_inferred_time_after_fatiha(
                 inferred_time=inferred_time,
                 fatiha_reset_times=fatiha_reset_times,
             )
             inferred_time = max(window_start, min(window_end, inferred_time))
-            previous_entry = entry_lookup.get((left.surah, rolling_prev_ayah))
+            previous_entry = entry_lookup.get((left_surah, rolling_prev_ayah))
             previous_duration = _estimated_ayah_duration_seconds(previous_entry)
             long_ayah_hold = int(round(previous_duration * 0.72)) if previous_duration >= 28 else max(6, int(round(step_seconds * 0.7)))
             start_floor_from_previous = rolling_prev_time + long_ayah_hold
@@ -3830,7 +4349,7 @@ def match_quran_markers(
                 continue
             if entry is not None:
                 wide_start = max(window_start, inferred_time)
-                wide_end = right.time - min_gap_seconds
+                wide_end = right_time - min_gap_seconds
                 if wide_end > wide_start:
                     wide_best_general = _try_wide_reground_before_infer(
                         transcript_segments=transcript_segments,
@@ -3843,6 +4362,8 @@ def match_quran_markers(
                         min_confidence=min_confidence,
                         ambiguous_min_score=ambiguous_min_score,
                         ambiguous_min_confidence=ambiguous_min_confidence,
+                        score_cache=score_cache,
+                        time_index=time_index,
                     )
                     if wide_best_general is not None:
                         matched_time, matched_end, quality, confidence = wide_best_general
@@ -3853,10 +4374,10 @@ def match_quran_markers(
                                 max(window_start, min(window_end, int(matched_time))),
                                 min(window_end, int(matched_end)),
                             ),
-                            surah=left.surah,
-                            surah_number=left.surah_number,
+                            surah=left_surah,
+                            surah_number=left_surah_number,
                             ayah=ayah_number,
-                            juz=get_juz_for_ayah(left.surah_number or 1, ayah_number),
+                            juz=get_juz_for_ayah(left_surah_number or 1, ayah_number),
                             quality=quality,
                             confidence=round(confidence, 3),
                         )
@@ -3869,7 +4390,7 @@ def match_quran_markers(
                 # Before inferring, always check a wider forward window to catch cases
                 # where the current ayah is long and the next ayah starts noticeably later.
                 forward_start = max(window_start, inferred_time + max(2, int(round(step_seconds * 0.35))), start_floor_from_previous)
-                forward_end = right.time - min_gap_seconds
+                forward_end = right_time - min_gap_seconds
                 if forward_end > forward_start:
                     best_forward_general = _find_best_ayah_timestamp(
                         transcript_segments=transcript_segments,
@@ -3882,6 +4403,8 @@ def match_quran_markers(
                         min_confidence=max(0.52, min_confidence - 0.10),
                         ambiguous_min_score=max(60, ambiguous_min_score - 10),
                         ambiguous_min_confidence=max(0.44, ambiguous_min_confidence - 0.08),
+                        score_cache=score_cache,
+                        time_index=time_index,
                     )
                     if best_forward_general is not None:
                         matched_time, matched_end, quality, confidence = best_forward_general
@@ -3892,10 +4415,10 @@ def match_quran_markers(
                                 max(window_start, min(window_end, int(matched_time))),
                                 min(window_end, int(matched_end)),
                             ),
-                            surah=left.surah,
-                            surah_number=left.surah_number,
+                            surah=left_surah,
+                            surah_number=left_surah_number,
                             ayah=ayah_number,
-                            juz=get_juz_for_ayah(left.surah_number or 1, ayah_number),
+                            juz=get_juz_for_ayah(left_surah_number or 1, ayah_number),
                             quality=quality,
                             confidence=round(confidence, 3),
                         )
@@ -3907,7 +4430,7 @@ def match_quran_markers(
             if entry is not None and strong_bridge:
                 # For strong-anchor bridges, search all the way toward the right anchor before inferring.
                 forward_start = max(window_start, inferred_time, start_floor_from_previous)
-                forward_end = right.time - min_gap_seconds
+                forward_end = right_time - min_gap_seconds
                 if forward_end > forward_start:
                     best_forward = _find_best_ayah_timestamp(
                         transcript_segments=transcript_segments,
@@ -3920,6 +4443,8 @@ def match_quran_markers(
                         min_confidence=max(0.54, min_confidence - 0.10),
                         ambiguous_min_score=max(62, ambiguous_min_score - 10),
                         ambiguous_min_confidence=max(0.45, ambiguous_min_confidence - 0.08),
+                        score_cache=score_cache,
+                        time_index=time_index,
                     )
                     if best_forward is not None:
                         matched_time, matched_end, quality, confidence = best_forward
@@ -3930,10 +4455,10 @@ def match_quran_markers(
                                 max(window_start, min(window_end, int(matched_time))),
                                 min(window_end, int(matched_end)),
                             ),
-                            surah=left.surah,
-                            surah_number=left.surah_number,
+                            surah=left_surah,
+                            surah_number=left_surah_number,
                             ayah=ayah_number,
-                            juz=get_juz_for_ayah(left.surah_number or 1, ayah_number),
+                            juz=get_juz_for_ayah(left_surah_number or 1, ayah_number),
                             quality=quality,
                             confidence=round(confidence, 3),
                         )
@@ -3943,14 +4468,15 @@ def match_quran_markers(
                         rolling_prev_time = int(marker_to_add.start_time or marker_to_add.time)
                         continue
             if require_weak_support_for_inferred and entry is not None:
-                window_start = max(left.time + min_gap_seconds, inferred_time - max(12, int(round(step_seconds))))
-                window_end = min(right.time - min_gap_seconds, inferred_time + max(12, int(round(step_seconds))))
+                window_start = max(left_time + min_gap_seconds, inferred_time - max(12, int(round(step_seconds))))
+                window_end = min(right_time - min_gap_seconds, inferred_time + max(12, int(round(step_seconds))))
                 if _has_low_data_gap(
                     transcript_segments=transcript_segments,
                     start_time=window_start,
                     end_time=window_end,
                     max_silence_seconds=16,
                     min_density=0.14,
+                    time_index=time_index,
                 ):
                     continue
                 if not _has_weak_local_support(
@@ -3960,18 +4486,20 @@ def match_quran_markers(
                     window_end=window_end,
                     min_score=max(60, ambiguous_min_score - 8),
                     min_overlap=max(0.07, min_overlap - 0.05),
+                    score_cache=score_cache,
+                    time_index=time_index,
                 ):
                     continue
             marker_to_add = Marker(
                 time=inferred_time,
                 start_time=inferred_time,
                 end_time=inferred_time,
-                surah=left.surah,
-                surah_number=left.surah_number,
+                surah=left_surah,
+                surah_number=left_surah_number,
                 ayah=ayah_number,
-                juz=get_juz_for_ayah(left.surah_number or 1, ayah_number),
+                juz=get_juz_for_ayah(left_surah_number or 1, ayah_number),
                 quality="inferred",
-                confidence=round(min(left.confidence or 0.58, right.confidence or 0.58, 0.6), 3),
+                confidence=round(min(left_confidence or 0.58, right_confidence or 0.58, 0.6), 3),
             )
 
             inferred_markers.append(marker_to_add)
@@ -4038,6 +4566,8 @@ def match_quran_markers(
                         min_confidence=min_confidence,
                         ambiguous_min_score=ambiguous_min_score,
                         ambiguous_min_confidence=ambiguous_min_confidence,
+                        score_cache=score_cache,
+                        time_index=time_index,
                     )
                     if best is not None:
                         matched_time, matched_end, quality, confidence = best
@@ -4071,6 +4601,8 @@ def match_quran_markers(
                         window_end=window_end,
                         min_score=max(60, ambiguous_min_score - 8),
                         min_overlap=max(0.07, min_overlap - 0.05),
+                        score_cache=score_cache,
+                        time_index=time_index,
                     ):
                         continue
                     marker_to_add = Marker(
@@ -4099,6 +4631,8 @@ def match_quran_markers(
         enforce_weak_support=require_weak_support_for_inferred,
         min_bridge_step_seconds=min_infer_step_seconds,
         max_bridge_step_seconds=max_infer_step_seconds,
+        score_cache=score_cache,
+        time_index=time_index,
     )
     merged.extend(coverage_inferred)
     merged = _dedupe_by_local_time_window(merged, window_seconds=90)
@@ -4113,6 +4647,8 @@ def match_quran_markers(
         min_confidence=min_confidence,
         ambiguous_min_score=ambiguous_min_score,
         ambiguous_min_confidence=ambiguous_min_confidence,
+        score_cache=score_cache,
+        time_index=time_index,
     )
     merged = _refine_inferred_markers_with_local_search(
         merged,
@@ -4124,12 +4660,15 @@ def match_quran_markers(
         min_confidence=min_confidence,
         ambiguous_min_score=ambiguous_min_score,
         ambiguous_min_confidence=ambiguous_min_confidence,
+        score_cache=score_cache,
+        time_index=time_index,
     )
     merged = _delay_weak_markers_after_resets(
         merged,
         fatiha_reset_times=fatiha_reset_times,
         transcript_segments=transcript_segments,
         hold_seconds=34,
+        time_index=time_index,
     )
     merged = _quran_first_refine_weak_markers(
         merged,
@@ -4140,6 +4679,8 @@ def match_quran_markers(
         min_confidence=min_confidence,
         ambiguous_min_score=ambiguous_min_score,
         ambiguous_min_confidence=ambiguous_min_confidence,
+        score_cache=score_cache,
+        time_index=time_index,
     )
     merged = _redistribute_dense_weak_runs(merged)
     merged = _stabilize_weak_marker_durations(merged)
@@ -4147,11 +4688,13 @@ def match_quran_markers(
         merged,
         transcript_segments=transcript_segments,
         entry_lookup=entry_lookup,
+        score_cache=score_cache,
     )
     merged = _extend_point_markers_to_next(merged, max_extension_seconds=90)
     merged = _prune_unrealistic_progression(merged)
     merged = _enforce_surah_transition_order(merged, surah_totals=surah_totals, min_gap_seconds=min_gap_seconds)
-    merged = _enforce_long_ayah_inferred_floor(merged, entry_lookup=entry_lookup)
+    entry_by_number = _entries_by_number(entry_lookup)
+    merged = _enforce_long_ayah_inferred_floor(merged, entry_by_number=entry_by_number)
     # Final continuity pass on the stabilized timeline: recover remaining ayah holes
     # using anchor-aware interpolation only when pacing is plausible.
     post_fill = _fill_surah_coverage_markers(
@@ -4164,6 +4707,8 @@ def match_quran_markers(
         enforce_weak_support=False,
         min_bridge_step_seconds=min_infer_step_seconds,
         max_bridge_step_seconds=max_infer_step_seconds,
+        score_cache=score_cache,
+        time_index=time_index,
     )
     if post_fill:
         merged.extend(post_fill)
@@ -4171,7 +4716,7 @@ def match_quran_markers(
         merged = _apply_overlap_conflict_resolution(merged)
         merged = _prune_unrealistic_progression(merged)
         merged = _enforce_surah_transition_order(merged, surah_totals=surah_totals, min_gap_seconds=min_gap_seconds)
-    merged = _enforce_long_ayah_inferred_floor(merged, entry_lookup=entry_lookup)
+    merged = _enforce_long_ayah_inferred_floor(merged, entry_by_number=entry_by_number)
     merged = _enforce_sequential_ayah_order(merged)
     merged = sorted(merged, key=lambda marker: (marker.time, marker.surah_number or 0, marker.ayah))
     return merged
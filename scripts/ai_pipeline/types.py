@@ -26,7 +26,7 @@ class PrayerSegment:
     reciter: str | None = None
 
 
-@dataclass
+@dataclass(slots=True)
 class Marker:
     time: int
     surah: str
@@ -49,3 +49,9 @@ class Marker:
         if self.end_time is None:
             self.end_time = int(self.start_time)
         self.time = int(self.start_time)
+
+    def shift_start(self, second: int) -> None:
+        # Moves the start to `second`, keeping end_time no earlier than the new start.
+        self.time = second
+        self.start_time = second
+        self.end_time = max(second, int(self.end_time or second))
@@ -30,6 +30,12 @@ def parse_args() -> argparse.Namespace:
         default=900,
         help="Process only first N seconds during tuning (default: 900).",
     )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=None,
+        help="Candidates to run in parallel; each loads its own whisper model (default: PIPELINE_DAY_WORKERS or 1).",
+    )
     return parser.parse_args()
 
 
@@ -60,7 +66,7 @@ def main() -> None:
     args = parse_args()
 
     try:
-        from ai_pipeline import process_day
+        from ai_pipeline import process_days
     except ImportError as exc:
         raise SystemExit(
             "Missing Python dependencies. Install with: pip install -r scripts/requirements-ai.txt"
@@ -79,25 +85,36 @@ def main() -> None:
         {"match_min_score": 88, "match_min_overlap": 0.2, "match_min_confidence": 0.72, "match_min_gap_seconds": 10},
     ]
 
+    jobs = [
+        {
+            "day": args.day,
+            "output_path": day_dir / f"candidate-{index}.json",
+            "cache_dir": Path("data/audio"),
+            "corpus_path": args.quran_corpus,
+            "profiles_path": Path("data/ai/reciter_profiles.json"),
+            "youtube_url": None,
+            "audio_file": args.audio_file,
+            "whisper_model": "tiny",
+            "bootstrap_reciters": False,
+            "reuse_transcript_cache": True,
+            "max_audio_seconds": args.max_audio_seconds,
+            **params,
+        }
+        for index, params in enumerate(param_grid, start=1)
+    ]
+    # The first candidate writes the transcript cache the others reuse, so it runs on its own.
+    payloads = process_days(jobs[:1], max_workers=1)
+    if payloads[0] is None:
+        raise SystemExit("First candidate failed; not starting the rest without a transcript cache")
+    payloads += process_days(jobs[1:], max_workers=args.workers)
+
     leaderboard: list[dict] = []
     best: dict | None = None
 
-    for index, params in enumerate(param_grid, start=1):
-        output_path = day_dir / f"candidate-{index}.json"
-        payload = process_day(
-            day=args.day,
-            output_path=output_path,
-            cache_dir=Path("data/audio"),
-            corpus_path=args.quran_corpus,
-            profiles_path=Path("data/ai/reciter_profiles.json"),
-            youtube_url=None,
-            audio_file=args.audio_file,
-            whisper_model="tiny",
-            bootstrap_reciters=False,
-            reuse_transcript_cache=True,
-            max_audio_seconds=args.max_audio_seconds,
-            **params,
-        )
+    for index, (params, job, payload) in enumerate(zip(param_grid, jobs, payloads), start=1):
+        if payload is None:
+            continue
+        output_path = job["output_path"]
 
         cache_suffix = f"{args.max_audio_seconds}s" if args.max_audio_seconds and args.max_audio_seconds > 0 else "full"
         transcript_cache = Path(f"data/ai/cache/day-{args.day}-transcript-{cache_suffix}.json")